@@ -1,49 +1,57 @@
 """
 Analyze team balance quality - both between teams and within teams.
 """
-import json
 import sys
 
+from src.utils import json_loads
+
 def analyze_teams(filename='output/balanced_teams.json'):
-    with open(filename, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    print("=" * 80)
-    print("TEAM BALANCE ANALYSIS")
-    print("=" * 80)
-    print(f"\nOverall Fairness Score: {data['fairness_score']:.2f}")
-    print(f"Average Team Skill: {data['average_team_skill']:.2f}\n")
-    
+    with open(filename, 'rb') as f:
+        data = json_loads(f.read())
+
+    # Buffer all report lines and emit them with a single write: one
+    # syscall/flush instead of one per print
+    out = []
+    out.append("=" * 80)
+    out.append("TEAM BALANCE ANALYSIS")
+    out.append("=" * 80)
+    out.append(f"\nOverall Fairness Score: {data['fairness_score']:.2f}")
+    out.append(f"Average Team Skill: {data['average_team_skill']:.2f}\n")
+
     internal_ranges = []
-    
+
     for team in data['teams']:
-        skills = [p['final_skill_score'] for p in team['players']]
-        skill_min = min(skills)
-        skill_max = max(skills)
+        # Extract and sort once: min/max fall out of the sorted list, and
+        # the same list feeds the display line below
+        skills = sorted(p['final_skill_score'] for p in team['players'])
+        skill_min = skills[0]
+        skill_max = skills[-1]
         skill_range = skill_max - skill_min
         skill_mean = sum(skills) / len(skills)
         skill_std = (sum((s - skill_mean) ** 2 for s in skills) / len(skills)) ** 0.5
-        
+
         internal_ranges.append(skill_range)
-        
-        print(f"Team {team['team_number']}:")
-        print(f"  Total Skill: {team['total_skill']:.2f}")
-        print(f"  Skills: {[round(s, 1) for s in sorted(skills)]}")
-        print(f"  Range: {skill_range:.1f} (min={skill_min:.1f}, max={skill_max:.1f})")
-        print(f"  Std Dev: {skill_std:.2f}")
-        print()
-    
-    print("=" * 80)
-    print("SUMMARY STATISTICS")
-    print("=" * 80)
-    print(f"Average internal range: {sum(internal_ranges) / len(internal_ranges):.2f}")
-    print(f"Max internal range: {max(internal_ranges):.2f}")
-    print(f"Min internal range: {min(internal_ranges):.2f}")
-    print(f"Teams with range > 35: {sum(1 for r in internal_ranges if r > 35)}/6")
-    print(f"Teams with range > 40: {sum(1 for r in internal_ranges if r > 40)}/6")
-    print(f"Teams with range > 45: {sum(1 for r in internal_ranges if r > 45)}/6")
+
+        out.append(f"Team {team['team_number']}:")
+        out.append(f"  Total Skill: {team['total_skill']:.2f}")
+        out.append(f"  Skills: {[round(s, 1) for s in skills]}")
+        out.append(f"  Range: {skill_range:.1f} (min={skill_min:.1f}, max={skill_max:.1f})")
+        out.append(f"  Std Dev: {skill_std:.2f}")
+        out.append("")
+
+    num_teams = len(internal_ranges)
+    out.append("=" * 80)
+    out.append("SUMMARY STATISTICS")
+    out.append("=" * 80)
+    out.append(f"Average internal range: {sum(internal_ranges) / num_teams:.2f}")
+    out.append(f"Max internal range: {max(internal_ranges):.2f}")
+    out.append(f"Min internal range: {min(internal_ranges):.2f}")
+    out.append(f"Teams with range > 35: {sum(1 for r in internal_ranges if r > 35)}/{num_teams}")
+    out.append(f"Teams with range > 40: {sum(1 for r in internal_ranges if r > 40)}/{num_teams}")
+    out.append(f"Teams with range > 45: {sum(1 for r in internal_ranges if r > 45)}/{num_teams}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == '__main__':
-    import sys
     filename = sys.argv[1] if len(sys.argv) > 1 else 'output/balanced_teams.json'
     analyze_teams(filename)
@@ -26,7 +26,8 @@ from .scoring import (
     compute_engine_score,
     get_familiarity_alpha,
     compute_final_skill_score,
-    compute_all_scores
+    compute_all_scores,
+    compute_all_scores_batch
 )
 from .smurf_detection import compute_smurf_suspicion
 from .balancing import (
@@ -61,7 +62,8 @@ __all__ = [
     'get_familiarity_alpha',
     'compute_final_skill_score',
     'compute_all_scores',
-    
+    'compute_all_scores_batch',
+
     # Smurf detection
     'compute_smurf_suspicion',
     
@@ -9,66 +9,272 @@ This module contains the core team balancing algorithms:
 """
 
 import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Tuple, List
 
 from .models import Player, TeamConfiguration
 from .config import get_config
 
 
+def _fairness_from_totals(team_total_skills: List[float]) -> Tuple[float, float]:
+    """
+    Compute fairness score directly from precomputed team totals.
+
+    Returns:
+        Tuple of (fairness_score, average_team_skill)
+    """
+    average_team_skill = sum(team_total_skills) / len(team_total_skills)
+
+    # Sum of squared deviations
+    fairness_score = sum((total - average_team_skill) ** 2
+                        for total in team_total_skills)
+
+    return fairness_score, average_team_skill
+
+
 def compute_fairness_score(teams: List[List[Player]]) -> Tuple[float, List[float], float]:
     """
     Compute fairness score for a team configuration.
-    
+
     Lower score = more balanced teams.
-    
+
+    This is a thin wrapper that extracts each player's skill once;
+    hot paths should work on plain skill matrices and call
+    _fairness_from_totals directly instead of walking Player objects.
+
     Args:
         teams: List of teams, each team is a list of Player objects
-    
+
     Returns:
         Tuple of:
         - fairness_score: sum of squared deviations from average
         - team_total_skills: list of total skill for each team
         - average_team_skill: mean of all team totals
     """
-    team_total_skills = []
-    
-    for team in teams:
-        team_total = sum(player.final_skill_score for player in team)
-        team_total_skills.append(team_total)
-    
-    average_team_skill = sum(team_total_skills) / len(team_total_skills)
-    
-    # Sum of squared deviations
-    fairness_score = sum((total - average_team_skill) ** 2 
-                        for total in team_total_skills)
-    
+    team_total_skills = [
+        sum(player.final_skill_score for player in team)
+        for team in teams
+    ]
+
+    fairness_score, average_team_skill = _fairness_from_totals(team_total_skills)
+
     return fairness_score, team_total_skills, average_team_skill
 
 
+def _optimize_swaps(
+    skill_rows: List[List[float]],
+    assignment: List[List[int]],
+    team_totals: List[float],
+    fairness: float,
+    avg_skill: float,
+    num_teams: int,
+    team_size: int,
+    num_iterations: int,
+    max_acceptable_range: float,
+    verbose: bool = False
+) -> Tuple[float, int]:
+    """
+    Hot optimization kernel: random swap search over a plain skill matrix.
+
+    Works purely on floats and ints - no Player objects, no dataclass
+    allocation - so the interpreter overhead per iteration is minimal.
+    Mutates skill_rows, assignment and team_totals in place; accepted
+    swaps touch exactly the two affected cells of each.
+
+    Args:
+        skill_rows: Skill matrix, skill_rows[i][k] = skill of player k on team i
+        assignment: Player-index matrix kept in sync with skill_rows
+        team_totals: Current total skill per team (mutated in place)
+        fairness: Current fairness score
+        avg_skill: Average team skill (invariant across swaps)
+        num_teams: Number of teams
+        team_size: Players per team
+        num_iterations: Number of swap attempts
+        max_acceptable_range: Max allowed internal skill range per team
+        verbose: Whether to print progress every 1000 iterations
+
+    Returns:
+        Tuple of (final fairness score, number of accepted swaps)
+    """
+    improvements = 0
+
+    # Early-exit heuristics: stop once the search has clearly converged.
+    # Fairness can't go below zero, so a near-zero score is already
+    # optimal; a long run without a single accepted swap means the
+    # neighborhood is exhausted for this start.
+    min_iterations = 1000
+    stagnation_limit = 500
+    fairness_epsilon = 1e-6
+    stagnation = 0
+
+    # Track each team's min/max skill so the range check is O(1) in the
+    # common case: a full rescan of a row is only needed when the player
+    # leaving it held that row's current extremum.
+    team_mins = [min(row) for row in skill_rows]
+    team_maxs = [max(row) for row in skill_rows]
+
+    # Bind the shared RNG's randrange once: it is a bound method of the
+    # module's hidden Random instance, so seeding via random.seed() still
+    # applies, but the per-call module-global lookup is gone. min/max are
+    # bound for the same reason - builtin lookups are not free in a loop
+    # that runs thousands of times.
+    randrange = random.randrange
+    row_min = min
+    row_max = max
+
+    for iteration in range(num_iterations):
+        # Draw two distinct teams branchlessly: offset the second draw by
+        # 1..num_teams-1 and wrap around. No list allocation, no rejection
+        # loop (random.sample builds a list and a range every call).
+        team_idx_1 = randrange(num_teams)
+        team_idx_2 = (team_idx_1 + 1 + randrange(num_teams - 1)) % num_teams
+        player_idx_1 = randrange(team_size)
+        player_idx_2 = randrange(team_size)
+
+        skill_1 = skill_rows[team_idx_1][player_idx_1]
+        skill_2 = skill_rows[team_idx_2][player_idx_2]
+
+        # Delta update: only the two affected totals change
+        delta = skill_2 - skill_1
+        total_1_new = team_totals[team_idx_1] + delta
+        total_2_new = team_totals[team_idx_2] - delta
+
+        new_fairness = (fairness
+                        - (team_totals[team_idx_1] - avg_skill) ** 2
+                        - (team_totals[team_idx_2] - avg_skill) ** 2
+                        + (total_1_new - avg_skill) ** 2
+                        + (total_2_new - avg_skill) ** 2)
+
+        if new_fairness >= fairness:
+            # Rejected swaps cost nothing - the matrix was never touched
+            stagnation += 1
+            if stagnation >= stagnation_limit and iteration >= min_iterations:
+                break
+            if verbose and (iteration + 1) % 1000 == 0:
+                print(f"  Iteration {iteration + 1:,}/{num_iterations:,} - Current: {fairness:.2f}, Improvements: {improvements}")
+            continue
+
+        # Perform swap on the skill matrix to check internal ranges
+        row_1 = skill_rows[team_idx_1]
+        row_2 = skill_rows[team_idx_2]
+        row_1[player_idx_1] = skill_2
+        row_2[player_idx_2] = skill_1
+
+        # New extrema for team 1: rescan only if its extremum just left
+        if skill_1 == team_mins[team_idx_1] or skill_1 == team_maxs[team_idx_1]:
+            min_1, max_1 = row_min(row_1), row_max(row_1)
+        else:
+            min_1 = team_mins[team_idx_1] if team_mins[team_idx_1] < skill_2 else skill_2
+            max_1 = team_maxs[team_idx_1] if team_maxs[team_idx_1] > skill_2 else skill_2
+
+        # Same for team 2
+        if skill_2 == team_mins[team_idx_2] or skill_2 == team_maxs[team_idx_2]:
+            min_2, max_2 = row_min(row_2), row_max(row_2)
+        else:
+            min_2 = team_mins[team_idx_2] if team_mins[team_idx_2] < skill_1 else skill_1
+            max_2 = team_maxs[team_idx_2] if team_maxs[team_idx_2] > skill_1 else skill_1
+
+        # Accept swap only if it doesn't create excessive polarization
+        # in either team (fairness improvement already verified above)
+        if (max_1 - min_1 <= max_acceptable_range and
+            max_2 - min_2 <= max_acceptable_range):
+
+            team_totals[team_idx_1] = total_1_new
+            team_totals[team_idx_2] = total_2_new
+            team_mins[team_idx_1], team_maxs[team_idx_1] = min_1, max_1
+            team_mins[team_idx_2], team_maxs[team_idx_2] = min_2, max_2
+            fairness = new_fairness
+            assignment[team_idx_1][player_idx_1], assignment[team_idx_2][player_idx_2] = (
+                assignment[team_idx_2][player_idx_2], assignment[team_idx_1][player_idx_1]
+            )
+            improvements += 1
+            stagnation = 0
+            if fairness <= fairness_epsilon:
+                # Perfectly balanced - nothing left to optimize
+                break
+        else:
+            # Revert the rejected swap in the skill matrix
+            row_1[player_idx_1] = skill_1
+            row_2[player_idx_2] = skill_2
+            stagnation += 1
+            if stagnation >= stagnation_limit and iteration >= min_iterations:
+                break
+
+        if verbose and (iteration + 1) % 1000 == 0:
+            print(f"  Iteration {iteration + 1:,}/{num_iterations:,} - Current: {fairness:.2f}, Improvements: {improvements}")
+
+    return fairness, improvements
+
+
+def _players_to_skills(players: List[Player]) -> List[float]:
+    """
+    Extract the skill column from a list of Player objects (AoS -> SoA).
+
+    All hot-path code works on this flat float list plus index arrays;
+    Player objects are only dereferenced again when building the final
+    TeamConfiguration.
+    """
+    return [p.final_skill_score for p in players]
+
+
+def _snake_assignment(skills: List[float], num_teams: int, team_size: int) -> List[List[int]]:
+    """
+    Snake draft on player indices.
+
+    Sorts player indices by skill (descending) and deals them in a snake
+    pattern (Team 1 -> N, then N -> 1, repeating).
+
+    Args:
+        skills: Flat skill list, skills[k] = skill of player k
+        num_teams: Number of teams
+        team_size: Players per team
+
+    Returns:
+        assignment[i] = list of player indices on team i
+    """
+    # list.__getitem__ is a C-level key (same trick as operator.attrgetter
+    # for object sorts), so no Python frame is entered per comparison
+    sorted_indices = sorted(range(len(skills)), key=skills.__getitem__, reverse=True)
+
+    # Deal the sorted indices into rounds of num_teams, reverse every odd
+    # round (the "snake" turn), then transpose rounds -> teams. The slice
+    # reverse and zip transpose run in C, replacing the per-player
+    # append loop with three bulk operations.
+    rounds = [sorted_indices[r * num_teams:(r + 1) * num_teams] for r in range(team_size)]
+    rounds[1::2] = [rnd[::-1] for rnd in rounds[1::2]]
+
+    return [list(team) for team in zip(*rounds)]
+
+
 def generate_balanced_teams(
     players: List[Player],
     num_teams: int,
     team_size: int,
     num_iterations: int = 5000,
-    verbose: bool = True
+    verbose: bool = True,
+    num_restarts: int = 1
 ) -> TeamConfiguration:
     """
     Generate balanced teams using hybrid Snake Draft + Local Optimization.
-    
+
     This hybrid approach:
     1. Snake draft (intelligent base distribution - naturally homogeneous)
     2. Local optimization (light swaps to reduce fairness without polarizing teams)
-    
+
     Args:
         players: List of Player objects with computed final_skill_scores
         num_teams: Number of teams to create
         team_size: Number of players per team
         num_iterations: Number of optimization iterations (default: 5000)
         verbose: Whether to print progress
-    
+        num_restarts: Number of independent optimization runs; with more
+            than one, runs execute in parallel worker processes and the
+            best result is kept (default: 1)
+
     Returns:
         TeamConfiguration with hybrid balanced team assignment
-    
+
     Raises:
         ValueError: If player count doesn't match num_teams * team_size
     """
@@ -79,85 +285,145 @@ def generate_balanced_teams(
             f"Player count mismatch: expected {expected_player_count} "
             f"({num_teams} teams × {team_size} players), got {len(players)}"
         )
-    
+
     if verbose:
         print(f"Generating balanced teams with Hybrid Snake Draft + Optimization...")
         print(f"Configuration: {len(players)} players, {num_teams} teams, {team_size} per team\n")
-    
+
+    # Structure-of-Arrays: one flat skill list plus an index assignment.
+    # The snake draft and the whole optimization run on these; Player
+    # objects are only materialized once at the end.
+    skills = _players_to_skills(players)
+
+    if num_restarts > 1:
+        return _generate_with_restarts(
+            players, skills, num_teams, team_size,
+            num_iterations, num_restarts, verbose
+        )
+
     # Step 1: Start with snake draft (natural homogeneity)
-    current_config = generate_balanced_teams_snake(players, num_teams, team_size)
-    current_fairness = current_config.fairness_score
-    
+    assignment = _snake_assignment(skills, num_teams, team_size)
+    skill_rows = [[skills[k] for k in row] for row in assignment]
+    team_totals = [sum(row) for row in skill_rows]
+    current_fairness, avg_skill = _fairness_from_totals(team_totals)
+
     if verbose:
         print(f"Initial fairness (snake draft): {current_fairness:.2f}")
-    
-    best_config = current_config
-    best_fairness = current_fairness
-    
+
     # Step 2: Local optimization - only accept swaps that improve fairness
     # AND don't create excessive internal polarization
     max_acceptable_range = get_config("max_acceptable_skill_range", 50.0)
-    improvements = 0
-    
-    for iteration in range(num_iterations):
-        # Try a random swap between two teams
-        team_idx_1, team_idx_2 = random.sample(range(num_teams), 2)
-        player_idx_1 = random.randint(0, team_size - 1)
-        player_idx_2 = random.randint(0, team_size - 1)
-        
-        # Copy current teams
-        new_teams = [team.copy() for team in current_config.teams]
-        
-        # Perform swap
-        player_1 = new_teams[team_idx_1][player_idx_1]
-        player_2 = new_teams[team_idx_2][player_idx_2]
-        
-        new_teams[team_idx_1][player_idx_1] = player_2
-        new_teams[team_idx_2][player_idx_2] = player_1
-        
-        # Compute new fairness
-        new_fairness, new_team_totals, new_avg_skill = compute_fairness_score(new_teams)
-        
-        # Check internal ranges for both affected teams
-        team1_skills = [p.final_skill_score for p in new_teams[team_idx_1]]
-        team2_skills = [p.final_skill_score for p in new_teams[team_idx_2]]
-        team1_range = max(team1_skills) - min(team1_skills)
-        team2_range = max(team2_skills) - min(team2_skills)
-        
-        # Accept swap only if:
-        # 1. It improves fairness (lower total deviation)
-        # 2. It doesn't create excessive polarization in either team
-        if (new_fairness < current_fairness and 
-            team1_range <= max_acceptable_range and 
-            team2_range <= max_acceptable_range):
-            
-            current_config = TeamConfiguration(
-                teams=new_teams,
-                fairness_score=new_fairness,
-                team_total_skills=new_team_totals,
-                average_team_skill=new_avg_skill
-            )
-            current_fairness = new_fairness
-            improvements += 1
-            
-            # Update best
-            if new_fairness < best_fairness:
-                best_config = current_config
-                best_fairness = new_fairness
-        
-        # Progress update
-        if verbose and (iteration + 1) % 1000 == 0:
-            print(f"  Iteration {iteration + 1:,}/{num_iterations:,} - Current: {current_fairness:.2f}, Best: {best_fairness:.2f}, Improvements: {improvements}")
-    
+
+    # The kernel mutates skill_rows, assignment and team_totals in place;
+    # every accepted swap strictly improves fairness, so the final state
+    # is also the best.
+    best_fairness, improvements = _optimize_swaps(
+        skill_rows, assignment, team_totals, current_fairness, avg_skill,
+        num_teams, team_size, num_iterations, max_acceptable_range,
+        verbose=verbose
+    )
+
+    best_config = TeamConfiguration(
+        teams=[[players[k] for k in row] for row in assignment],
+        fairness_score=best_fairness,
+        team_total_skills=team_totals,
+        average_team_skill=avg_skill,
+        team_skills=skill_rows
+    )
+
     if verbose:
         print(f"\nOptimization complete!")
         print(f"Final fairness: {best_fairness:.2f}")
-        print(f"Improvement from snake draft: {current_config.fairness_score - best_fairness:.2f}")
+        print(f"Improvement from snake draft: {current_fairness - best_fairness:.2f}")
         print(f"Total successful swaps: {improvements}")
-    
+
     return best_config
 
 
+def _run_restart(
+    skills: List[float],
+    num_teams: int,
+    team_size: int,
+    num_iterations: int,
+    max_acceptable_range: float,
+    seed: int
+) -> Tuple[float, List[List[int]]]:
+    """
+    One independent snake draft + swap search, seeded for reproducibility.
+
+    Module-level (not a closure) so ProcessPoolExecutor can pickle it.
+
+    Returns:
+        Tuple of (fairness_score, final index assignment)
+    """
+    random.seed(seed)
+
+    assignment = _snake_assignment(skills, num_teams, team_size)
+    skill_rows = [[skills[k] for k in row] for row in assignment]
+    team_totals = [sum(row) for row in skill_rows]
+    fairness, avg_skill = _fairness_from_totals(team_totals)
+
+    fairness, _ = _optimize_swaps(
+        skill_rows, assignment, team_totals, fairness, avg_skill,
+        num_teams, team_size, num_iterations, max_acceptable_range
+    )
+
+    return fairness, assignment
+
+
+def _generate_with_restarts(
+    players: List[Player],
+    skills: List[float],
+    num_teams: int,
+    team_size: int,
+    num_iterations: int,
+    num_restarts: int,
+    verbose: bool
+) -> TeamConfiguration:
+    """
+    Run num_restarts independent optimizations in parallel worker
+    processes and keep the assignment with the best fairness.
+
+    Restarts are embarrassingly parallel: each worker only needs the flat
+    skill list and a seed. Seeds are drawn from the shared RNG, so a
+    caller-level random.seed() still makes the whole run reproducible.
+    """
+    max_acceptable_range = get_config("max_acceptable_skill_range", 50.0)
+    seeds = [random.randrange(2 ** 32) for _ in range(num_restarts)]
+
+    # Track the best with a scalar and keep only the winning assignment;
+    # losing assignments are dropped as soon as their score is recorded
+    worker = partial(_run_restart, skills, num_teams, team_size,
+                     num_iterations, max_acceptable_range)
+    restart_scores = []
+    best_fairness = float('inf')
+    assignment = None
+    with ProcessPoolExecutor() as pool:
+        for fairness, restart_assignment in pool.map(worker, seeds):
+            restart_scores.append(fairness)
+            if fairness < best_fairness:
+                best_fairness = fairness
+                assignment = restart_assignment
+
+    skill_rows = [[skills[k] for k in row] for row in assignment]
+    team_totals = [sum(row) for row in skill_rows]
+    _, avg_skill = _fairness_from_totals(team_totals)
+
+    if verbose:
+        print(f"Ran {num_restarts} parallel restarts")
+        print(f"Restart fairness scores: {', '.join(f'{f:.2f}' for f in restart_scores)}")
+        print(f"\nOptimization complete!")
+        print(f"Final fairness: {best_fairness:.2f}")
+
+    return TeamConfiguration(
+        teams=[[players[k] for k in row] for row in assignment],
+        fairness_score=best_fairness,
+        team_total_skills=team_totals,
+        average_team_skill=avg_skill,
+        team_skills=skill_rows
+    )
+
+
 def generate_balanced_teams_snake(
     players: List[Player],
     num_teams: int,
@@ -193,34 +459,22 @@ def generate_balanced_teams_snake(
             f"({num_teams} teams × {team_size} players), got {len(players)}"
         )
     
-    # Sort players by skill (descending: best first)
-    sorted_players = sorted(players, key=lambda p: p.final_skill_score, reverse=True)
-    
-    # Initialize teams
-    teams = [[] for _ in range(num_teams)]
-    
-    # Snake draft assignment
-    player_idx = 0
-    for round_num in range(team_size):
-        if round_num % 2 == 0:
-            # Even rounds: left to right (Team 1 → N)
-            for team_idx in range(num_teams):
-                teams[team_idx].append(sorted_players[player_idx])
-                player_idx += 1
-        else:
-            # Odd rounds: right to left (Team N → 1)
-            for team_idx in range(num_teams - 1, -1, -1):
-                teams[team_idx].append(sorted_players[player_idx])
-                player_idx += 1
-    
-    # Compute fairness
-    fairness, team_totals, avg_skill = compute_fairness_score(teams)
-    
+    # Snake draft on player indices, then materialize the Player teams
+    skills = _players_to_skills(players)
+    assignment = _snake_assignment(skills, num_teams, team_size)
+    teams = [[players[k] for k in row] for row in assignment]
+
+    # Compute fairness from the flat skill list
+    skill_rows = [[skills[k] for k in row] for row in assignment]
+    team_totals = [sum(row) for row in skill_rows]
+    fairness, avg_skill = _fairness_from_totals(team_totals)
+
     return TeamConfiguration(
         teams=teams,
         fairness_score=fairness,
         team_total_skills=team_totals,
-        average_team_skill=avg_skill
+        average_team_skill=avg_skill,
+        team_skills=skill_rows
     )
 
 
@@ -252,47 +506,43 @@ def replace_player_in_team(
     if replacement_player.final_skill_score == 0:
         compute_all_scores(replacement_player)
     
-    # Find which team and position the leaving player is in
-    team_index = None
-    player_index = None
-    
-    for t_idx, team in enumerate(config.teams):
-        for p_idx, player in enumerate(team):
-            if player.player_name == player_to_replace_name:
-                team_index = t_idx
-                player_index = p_idx
-                break
-        if team_index is not None:
-            break
-    
-    if team_index is None:
-        raise ValueError(f"Player '{player_to_replace_name}' not found in any team")
-    
-    # Create new teams list with replacement
-    new_teams = []
-    for t_idx, team in enumerate(config.teams):
-        if t_idx == team_index:
-            # Replace the player in this team
-            new_team = team.copy()
-            new_team[player_index] = replacement_player
-            new_teams.append(new_team)
-        else:
-            new_teams.append(team.copy())
-    
-    # Recalculate team totals
-    new_team_totals = [
-        sum(player.final_skill_score for player in team)
-        for team in new_teams
-    ]
-    
-    # Recalculate fairness
-    avg_skill = sum(new_team_totals) / len(new_team_totals)
-    new_fairness = sum((total - avg_skill) ** 2 for total in new_team_totals)
-    
+    # Find which team and position the leaving player is in - a single
+    # dict lookup instead of scanning every roster
+    try:
+        team_index, player_index = config.name_index()[player_to_replace_name]
+    except KeyError:
+        raise ValueError(f"Player '{player_to_replace_name}' not found in any team") from None
+    
+    # Only the affected team's list is copied; the other teams are shared
+    # by reference (TeamConfiguration is treated as immutable by callers)
+    leaving_skill = config.teams[team_index][player_index].final_skill_score
+    new_teams = list(config.teams)
+    new_team = list(new_teams[team_index])
+    new_team[player_index] = replacement_player
+    new_teams[team_index] = new_team
+
+    # Mirror the replacement in the skill matrix, reusing the cached one
+    # when available instead of re-walking every Player
+    if config.team_skills is not None:
+        new_skill_rows = list(config.team_skills)
+        new_row = list(new_skill_rows[team_index])
+        new_row[player_index] = replacement_player.final_skill_score
+        new_skill_rows[team_index] = new_row
+        new_team_totals = list(config.team_total_skills)
+        new_team_totals[team_index] += replacement_player.final_skill_score - leaving_skill
+    else:
+        new_skill_rows = [[p.final_skill_score for p in team] for team in new_teams]
+        new_team_totals = [sum(row) for row in new_skill_rows]
+
+    # Recalculate fairness: one team total and the average moved, so this
+    # is O(num_teams) over the totals rather than a walk of every player
+    new_fairness, avg_skill = _fairness_from_totals(new_team_totals)
+
     # Return updated configuration
     return TeamConfiguration(
         teams=new_teams,
         team_total_skills=new_team_totals,
         fairness_score=new_fairness,
-        average_team_skill=avg_skill
+        average_team_skill=avg_skill,
+        team_skills=new_skill_rows
     )
@@ -1,28 +1,54 @@
 """Configuration management for team balancing system."""
 
-import json
 import sys
+from functools import lru_cache
 from typing import Dict, Any
 
 
-# Global configuration variable
+# Global configuration variable. Reassigned only by load_config, which
+# is also the only supported way to change configuration at runtime:
+# get_config memoizes lookups and the scoring snapshot caches whole
+# sections by CONFIG_VERSION, so in-place edits (CONFIG[k] = v) are not
+# observed until the next load_config.
 CONFIG: Dict[str, Any] = {}
 
+# Incremented on every load_config; lets caches keyed on the version
+# (e.g. the scoring snapshot) invalidate without explicit hooks
+CONFIG_VERSION: int = 0
+
+# Sentinel distinguishing "key absent" from a stored None
+_MISSING = object()
+
 
 def load_config(config_path: str) -> None:
     """Load configuration from JSON file."""
-    global CONFIG
+    global CONFIG, CONFIG_VERSION
+    from .utils import json_loads
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            CONFIG = json.load(f)
+        with open(config_path, 'rb') as f:
+            CONFIG = json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: Config file '{config_path}' not found.")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
         print(f"Error: Failed to parse config file '{config_path}': {e}")
         sys.exit(1)
+    CONFIG_VERSION += 1
+    _lookup.cache_clear()
+
+
+@lru_cache(maxsize=128)
+def _lookup(key: str) -> Any:
+    """Memoized raw lookup. Cached on key only, so callers may pass
+    unhashable defaults to get_config without breaking the cache.
+    Entries live until load_config calls cache_clear — mutating CONFIG
+    directly leaves this cache (and the version-keyed scoring snapshot)
+    serving the old values."""
+    return CONFIG.get(key, _MISSING)
 
 
 def get_config(key: str, default: Any = None) -> Any:
     """Safely get a value from the global configuration."""
-    return CONFIG.get(key, default)
+    value = _lookup(key)
+    return default if value is _MISSING else value
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player with all rating components."""
     # Identity
@@ -44,12 +44,29 @@ class Player:
     
     # Metadata
     rank_group: str = ""  # "low", "mid", or "high"
+    rank_group_id: int = 1  # 0=low, 1=mid, 2=high; int twin of rank_group
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamConfiguration:
     """Represents a team assignment configuration."""
     teams: list[list[Player]]  # List of teams, each team is list of players
     fairness_score: float
     team_total_skills: list[float]  # Total skill for each team
     average_team_skill: float
+    # Denormalized skill matrix mirroring teams: team_skills[i][k] is the
+    # final_skill_score of teams[i][k]. Lets stats/replacement code work
+    # on plain floats instead of re-walking Player objects.
+    team_skills: Optional[list[list[float]]] = None
+    # Lazy player_name -> (team_idx, player_idx) lookup; use name_index()
+    _name_index: Optional[dict[str, tuple[int, int]]] = field(default=None, repr=False)
+
+    def name_index(self) -> dict[str, tuple[int, int]]:
+        """Map player_name to (team_idx, player_idx), built on first use."""
+        if self._name_index is None:
+            self._name_index = {
+                player.player_name: (t_idx, p_idx)
+                for t_idx, team in enumerate(self.teams)
+                for p_idx, player in enumerate(team)
+            }
+        return self._name_index
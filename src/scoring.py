@@ -1,89 +1,179 @@
 """Player scoring system for team balancing."""
 
-from src.models import Player
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from typing import NamedTuple, Optional
+
+from src import config
 from src.config import get_config
+from src.models import Player
 from src.smurf_detection import compute_smurf_suspicion
 
 
-def get_rank_group(rank: str) -> str:
+class _ConfigSnapshot(NamedTuple):
+    """Materialized view of every config section the scoring pipeline reads.
+
+    Scoring a single player used to trigger ~15 get_config lookups; the
+    snapshot is built once per loaded config and handed through the
+    pipeline, so the hot path does plain attribute reads instead of
+    repeated dict probes.
+    """
+    rank_mapping: dict
+    rr_scores: tuple  # scores for Immortal 1/2/3, Radiant (RR tiers)
+    kd_thresholds: dict
+    acs_thresholds: dict
+    clamp_offsets: dict
+    smurf_config: dict
+    fam_thresholds: tuple
+    fam_alphas: tuple
+    rank_to_group: dict
+    # Scalar weights folded out of their config dicts: the hot path reads
+    # a precomputed float instead of probing a dict per call
+    rank_w_current: float
+    rank_w_peak: float
+    stats_w_kd: float
+    stats_w_acs: float
+    engine_w_rank: float
+    engine_w_stats: float
+    penalty_scaled: float  # smurf_penalty_factor / 100, pre-divided
+    default_community: float
+    default_familiarity: float
+
+
+@lru_cache(maxsize=1)
+def _snapshot(version: int) -> _ConfigSnapshot:
+    """Build the snapshot for one config version.
+
+    Keyed on CONFIG_VERSION, which load_config bumps on every reload, so
+    a stale snapshot can never outlive the config it was built from.
+    """
+    # Ascending copy for binary search; the raw config lists thresholds
+    # descending for the legacy scan order
+    alpha_sorted = sorted(get_config("familiarity_alpha_thresholds", []))
+    rank_weights = get_config("rank_weights", {"current": 0.6, "peak": 0.4})
+    stats_weights = get_config("stats_weights", {"kd": 0.6, "acs": 0.4})
+    engine_weights = get_config("engine_weights", {"rank": 0.6, "stats": 0.4})
+    smurf_config = get_config("smurf_config", {})
+    defaults = get_config("defaults", {})
+    rank_mapping = get_config("rank_score_mapping", {})
+    return _ConfigSnapshot(
+        rank_mapping=rank_mapping,
+        # One entry per 100 RR: 0-99 Immortal 1, 100-199 Immortal 2,
+        # 200-299 Immortal 3, 300+ Radiant
+        rr_scores=(rank_mapping.get("Immortal 1", 80),
+                   rank_mapping.get("Immortal 2", 86),
+                   rank_mapping.get("Immortal 3", 92),
+                   rank_mapping.get("Radiant", 98)),
+        kd_thresholds=get_config("kd_thresholds", {}),
+        acs_thresholds=get_config("acs_thresholds", {}),
+        clamp_offsets=get_config("engine_clamp_max_offset", {}),
+        smurf_config=smurf_config,
+        fam_thresholds=tuple(t for t, _ in alpha_sorted),
+        fam_alphas=tuple(a for _, a in alpha_sorted),
+        # Inverted index: one hash lookup per rank instead of scanning
+        # every group's member list
+        rank_to_group={rank: group
+                       for group, ranks in get_config("rank_groups", {}).items()
+                       for rank in ranks},
+        rank_w_current=rank_weights["current"],
+        rank_w_peak=rank_weights["peak"],
+        stats_w_kd=stats_weights["kd"],
+        stats_w_acs=stats_weights["acs"],
+        engine_w_rank=engine_weights["rank"],
+        engine_w_stats=engine_weights["stats"],
+        penalty_scaled=smurf_config.get("smurf_penalty_factor", 0.7) * 0.01,
+        default_community=defaults.get("community_score", 50),
+        default_familiarity=defaults.get("familiarity_score", 0.0),
+    )
+
+
+def _current_snapshot() -> _ConfigSnapshot:
+    """Snapshot for the currently loaded config."""
+    return _snapshot(config.CONFIG_VERSION)
+
+
+# Sort key for threshold (value, score) pairs
+_threshold_key = itemgetter(0)
+
+
+def _parse_rr(rank: str) -> Optional[int]:
+    """
+    Parse an "NNNRR" Radiant-Rating string; returns None for normal rank
+    names. endswith + slice validation avoids the substring replace and
+    the exception-guarded int() the two inline parsers used to duplicate.
+    """
+    if rank.endswith("RR"):
+        digits = rank[:-2].strip()
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+
+def get_rank_group(rank: str, snap: Optional[_ConfigSnapshot] = None) -> str:
     """
     Determine which rank group a player belongs to (low/mid/high).
     Used for stats normalization.
+
+    The same ~25 rank strings recur across a roster, so the answer is
+    memoized per (rank, config version).
     """
-    # Handle RR (Radiant Rating) format: "300RR" or "34RR"
-    if "RR" in rank:
-        try:
-            rr_value = int(rank.replace("RR", "").strip())
-            # All RR players are high elo (Immortal/Radiant)
-            # RR range: 0-99 = Immortal 1, 100-199 = Immortal 2, 200-299 = Immortal 3, 300+ = Radiant
-            if rr_value >= 300:
-                return "high"  # Radiant
-            elif rr_value >= 200:
-                return "high"  # Immortal 3
-            elif rr_value >= 100:
-                return "high"  # Immortal 2
-            else:
-                return "high"  # Immortal 1
-        except ValueError:
-            pass
-    
-    rank_groups = get_config("rank_groups", {})
-    for group_name, ranks in rank_groups.items():
-        if rank in ranks:
-            return group_name
+    return _rank_group_cached(rank, config.CONFIG_VERSION)
+
+
+@lru_cache(maxsize=64)
+def _rank_group_cached(rank: str, version: int) -> str:
+    snap = _snapshot(version)
+
+    # Handle RR (Radiant Rating) format: "300RR" or "34RR" — every RR
+    # player is high elo (Immortal/Radiant) regardless of the value
+    if _parse_rr(rank) is not None:
+        return "high"
+
     # Default to mid if rank not found
-    return "mid"
+    return snap.rank_to_group.get(rank, "mid")
+
+
+@lru_cache(maxsize=64)
+def _rank_to_score(rank_str: str, version: int) -> int:
+    """Parse one rank string to its score, memoized per config version."""
+    snap = _snapshot(version)
+
+    # Check if it's RR format (e.g., "300RR", "34RR"): one RR tier per
+    # 100 points, capped at Radiant
+    rr_value = _parse_rr(rank_str)
+    if rr_value is not None:
+        return snap.rr_scores[min(rr_value // 100, 3)]
 
+    # Normal rank string (e.g., "Ascendant 2")
+    return snap.rank_mapping.get(rank_str, 50)
 
-def compute_rank_score(player: Player) -> float:
+
+def compute_rank_score(player: Player, snap: Optional[_ConfigSnapshot] = None) -> float:
     """
     Compute rank score from current rank and recent peak rank.
     Returns score in range 0-100.
-    
+
     Formula: rank_score = 0.6 * current + 0.4 * peak
     """
-    rank_mapping = get_config("rank_score_mapping", {})
-    
-    # Handle RR (Radiant Rating) format: "300RR" or "34RR"
-    def parse_rank_to_score(rank_str: str) -> int:
-        # Check if it's RR format (e.g., "300RR", "34RR")
-        if "RR" in rank_str:
-            try:
-                rr_value = int(rank_str.replace("RR", "").strip())
-                # RR players are high Immortal/Radiant
-                # 0-99 RR = Immortal 1, 100-199 = Immortal 2, 200-299 = Immortal 3, 300+ = Radiant
-                if rr_value >= 300:
-                    return rank_mapping.get("Radiant", 98)
-                elif rr_value >= 200:
-                    return rank_mapping.get("Immortal 3", 92)
-                elif rr_value >= 100:
-                    return rank_mapping.get("Immortal 2", 86)
-                else:
-                    return rank_mapping.get("Immortal 1", 80)
-            except ValueError:
-                pass
-        
-        # Normal rank string (e.g., "Ascendant 2")
-        return rank_mapping.get(rank_str, 50)
-    
-    current_score = parse_rank_to_score(player.rank_current)
-    peak_score = parse_rank_to_score(player.rank_peak_recent)
-    
-    rank_weights = get_config("rank_weights", {"current": 0.6, "peak": 0.4})
-    rank_score = (rank_weights["current"] * current_score + 
-                  rank_weights["peak"] * peak_score)
-    
-    return rank_score
+    if snap is None:
+        snap = _current_snapshot()
+    version = config.CONFIG_VERSION
+
+    current_score = _rank_to_score(player.rank_current, version)
+    peak_score = _rank_to_score(player.rank_peak_recent, version)
+
+    return snap.rank_w_current * current_score + snap.rank_w_peak * peak_score
 
 
 def interpolate_score(value: float, thresholds: list[tuple[float, float]]) -> float:
     """
     Linear interpolation between threshold points.
-    
+
     Args:
         value: The value to score (e.g., KD ratio or ACS)
         thresholds: List of (threshold_value, score) tuples, sorted ascending
-    
+
     Returns:
         Interpolated score in range 0-100
     """
@@ -91,171 +181,275 @@ def interpolate_score(value: float, thresholds: list[tuple[float, float]]) -> fl
         return thresholds[0][1]
     if value >= thresholds[-1][0]:
         return thresholds[-1][1]
-    
-    for i in range(len(thresholds) - 1):
-        lower_threshold, lower_score = thresholds[i]
-        upper_threshold, upper_score = thresholds[i + 1]
-        
-        if lower_threshold <= value <= upper_threshold:
-            ratio = (value - lower_threshold) / (upper_threshold - lower_threshold)
-            score = lower_score + ratio * (upper_score - lower_score)
-            return score
-    
-    return 50
-
-
-def compute_stats_score(player: Player) -> float:
+
+    # Binary search (C level) for the bracketing segment instead of a
+    # Python-level scan over every pair
+    i = bisect_right(thresholds, value, key=_threshold_key) - 1
+    lower_threshold, lower_score = thresholds[i]
+    upper_threshold, upper_score = thresholds[i + 1]
+
+    ratio = (value - lower_threshold) / (upper_threshold - lower_threshold)
+    return lower_score + ratio * (upper_score - lower_score)
+
+
+def compute_stats_score(player: Player, snap: Optional[_ConfigSnapshot] = None) -> float:
     """
     Compute stats score from KD and ACS, normalized by rank group.
     Returns score in range 0-100.
-    
+
     Formula: stats_score = 0.6 * kd_score + 0.4 * acs_score
     If ACS missing: stats_score = kd_score
     """
+    if snap is None:
+        snap = _current_snapshot()
     rank_group = player.rank_group
-    
+
     # Compute KD score
-    kd_thresholds_map = get_config("kd_thresholds", {})
+    kd_thresholds_map = snap.kd_thresholds
     kd_thresholds = kd_thresholds_map.get(rank_group, kd_thresholds_map.get("mid", []))
-    
+
     if not kd_thresholds:
         kd_score = 50.0
     else:
         kd_score = interpolate_score(player.kd_ratio, kd_thresholds)
-    
-    stats_weights = get_config("stats_weights", {"kd": 0.6, "acs": 0.4})
 
     # Compute ACS score if available
     if player.average_combat_score is not None:
-        acs_thresholds_map = get_config("acs_thresholds", {})
+        acs_thresholds_map = snap.acs_thresholds
         acs_thresholds = acs_thresholds_map.get(rank_group, acs_thresholds_map.get("mid", []))
-        
+
         if not acs_thresholds:
             acs_score = 50.0
         else:
             acs_score = interpolate_score(player.average_combat_score, acs_thresholds)
-            
-        stats_score = stats_weights["kd"] * kd_score + stats_weights["acs"] * acs_score
+
+        stats_score = snap.stats_w_kd * kd_score + snap.stats_w_acs * acs_score
     else:
         # No ACS data: use KD only
         stats_score = kd_score
-    
+
     return stats_score
 
 
-def compute_community_score_and_familiarity(player: Player) -> tuple[float, float]:
+def compute_community_score_and_familiarity(player: Player,
+                                            snap: Optional[_ConfigSnapshot] = None) -> tuple[float, float]:
     """
     Compute community score and familiarity score from admin rating.
-    
+
     Returns:
         (community_score, familiarity_score) tuple
         - community_score: 0-100 (skill rating * 10)
         - familiarity_score: 0-1 (familiarity / 3)
-    
+
     If no admin rating exists, returns defaults.
     """
-    defaults = get_config("defaults", {})
-    default_community = defaults.get("community_score", 50)
-    default_familiarity = defaults.get("familiarity_score", 0.0)
+    if snap is None:
+        snap = _current_snapshot()
 
     if player.admin_skill_rating is None or player.admin_familiarity is None:
-        return default_community, default_familiarity
-    
+        return snap.default_community, snap.default_familiarity
+
     # Scale skill rating from 1-10 to 10-100
     community_score = player.admin_skill_rating * 10
-    
+
     # Scale familiarity from 1-3 to 0.33-1.0
     familiarity_score = player.admin_familiarity / 3.0
-    
+
     return community_score, familiarity_score
 
 
-def compute_engine_score(player: Player) -> float:
+def compute_engine_score(player: Player, snap: Optional[_ConfigSnapshot] = None) -> float:
     """
     Compute engine score (combination of rank + stats) with clamp.
     Returns score in range 0-100.
-    
+
     Formula: engine_score = 0.6 * rank_score + 0.4 * stats_score
     Then apply clamp to prevent unrealistic inflation from stats.
-    
+
     The clamp is dynamically adjusted based on smurf suspicion:
     - High suspicion → tighter clamp (stats can't push score as high above rank)
     - Low suspicion → normal clamp
     """
-    engine_weights = get_config("engine_weights", {"rank": 0.6, "stats": 0.4})
-    base_engine_score = (engine_weights["rank"] * player.rank_score + 
-                         engine_weights["stats"] * player.stats_score)
-    
+    if snap is None:
+        snap = _current_snapshot()
+    base_engine_score = (snap.engine_w_rank * player.rank_score +
+                         snap.engine_w_stats * player.stats_score)
+
     # Get base clamp offset for rank group
-    clamp_offsets = get_config("engine_clamp_max_offset", {})
-    base_offset = clamp_offsets.get(player.rank_group, 15)
-    
-    # Apply smurf suspicion penalty to clamp
-    suspicion_factor = player.smurf_suspicion_score / 100.0
-    smurf_config = get_config("smurf_config", {})
-    penalty_factor = smurf_config.get("smurf_penalty_factor", 0.7)
-    effective_offset = base_offset * (1.0 - penalty_factor * suspicion_factor)
-    
+    base_offset = snap.clamp_offsets.get(player.rank_group, 15)
+
+    # Apply smurf suspicion penalty to clamp: the offset shrinks linearly
+    # with suspicion, fused into one multiply-subtract chain
+    effective_offset = (base_offset -
+                        base_offset * snap.penalty_scaled * player.smurf_suspicion_score)
+
     # Apply the dynamic clamp
-    max_allowed_engine_score = player.rank_score + effective_offset
-    engine_score = min(base_engine_score, max_allowed_engine_score)
-    
-    return engine_score
+    return min(base_engine_score, player.rank_score + effective_offset)
 
 
-def get_familiarity_alpha(familiarity_score: float) -> float:
+def get_familiarity_alpha(familiarity_score: float,
+                          snap: Optional[_ConfigSnapshot] = None) -> float:
     """
     Get alpha value for blending community and engine scores based on familiarity.
-    
+
     Returns alpha where:
         final_skill = community + alpha * (engine - community)
-    
+
     High familiarity → low alpha → trust community more
     Low familiarity → high alpha → trust engine more
     """
-    alpha_thresholds = get_config("familiarity_alpha_thresholds", [])
-    for threshold, alpha in alpha_thresholds:
-        if familiarity_score >= threshold:
-            return alpha
-    return 1.0
+    if snap is None:
+        snap = _current_snapshot()
+    # Rightmost threshold <= familiarity_score wins (binary search over
+    # the ascending-sorted copy built at snapshot time)
+    idx = bisect_right(snap.fam_thresholds, familiarity_score) - 1
+    return snap.fam_alphas[idx] if idx >= 0 else 1.0
 
 
-def compute_final_skill_score(player: Player) -> float:
+def compute_final_skill_score(player: Player, snap: Optional[_ConfigSnapshot] = None) -> float:
     """
     Compute final skill score by blending community and engine scores
     based on familiarity.
-    
+
     Formula: final = community + alpha(familiarity) * (engine - community)
     """
-    alpha = get_familiarity_alpha(player.familiarity_score)
-    
-    final_score = (player.community_score + 
-                   alpha * (player.engine_score - player.community_score))
-    
-    # Ensure score stays in valid range
-    final_score = max(0, min(100, final_score))
-    
-    return final_score
-
-
-def compute_all_scores(player: Player) -> None:
+    if snap is None:
+        snap = _current_snapshot()
+    alpha = get_familiarity_alpha(player.familiarity_score, snap)
+    community = player.community_score
+
+    # Lerp then clamp to the valid range, as one expression
+    return max(0, min(100, community + alpha * (player.engine_score - community)))
+
+
+def _compute_all_scores_fused(player: Player, snap: _ConfigSnapshot) -> None:
+    """
+    Straight-line scoring pipeline operating on locals.
+
+    Mirrors the five steps of the public helpers with every player
+    attribute loaded once and a single write-back block at the end; the
+    helpers above remain the readable reference implementations.
+    """
+    version = config.CONFIG_VERSION
+    rank_current = player.rank_current
+    kd_ratio = player.kd_ratio
+    acs = player.average_combat_score
+    admin_skill = player.admin_skill_rating
+    admin_familiarity = player.admin_familiarity
+
+    # Step 1: rank group (smurf detection reads it from the player)
+    rank_group = _rank_group_cached(rank_current, version)
+    player.rank_group = rank_group
+
+    # Step 2a: rank score
+    rank_score = (snap.rank_w_current * _rank_to_score(rank_current, version) +
+                  snap.rank_w_peak * _rank_to_score(player.rank_peak_recent, version))
+
+    # Step 2b: stats score
+    kd_thresholds_map = snap.kd_thresholds
+    kd_thresholds = kd_thresholds_map.get(rank_group, kd_thresholds_map.get("mid", []))
+    kd_score = interpolate_score(kd_ratio, kd_thresholds) if kd_thresholds else 50.0
+    if acs is not None:
+        acs_thresholds_map = snap.acs_thresholds
+        acs_thresholds = acs_thresholds_map.get(rank_group, acs_thresholds_map.get("mid", []))
+        acs_score = interpolate_score(acs, acs_thresholds) if acs_thresholds else 50.0
+        stats_score = snap.stats_w_kd * kd_score + snap.stats_w_acs * acs_score
+    else:
+        # No ACS data: use KD only
+        stats_score = kd_score
+
+    # Step 2c: community score and familiarity
+    if admin_skill is None or admin_familiarity is None:
+        community_score = snap.default_community
+        familiarity_score = snap.default_familiarity
+    else:
+        community_score = admin_skill * 10
+        familiarity_score = admin_familiarity / 3.0
+
+    # Step 3: smurf suspicion (must be done before engine score)
+    suspicion = compute_smurf_suspicion(player, snap.smurf_config)
+
+    # Step 4: engine score with the suspicion-tightened clamp
+    base_engine = snap.engine_w_rank * rank_score + snap.engine_w_stats * stats_score
+    base_offset = snap.clamp_offsets.get(rank_group, 15)
+    engine_score = min(base_engine,
+                       rank_score + base_offset -
+                       base_offset * snap.penalty_scaled * suspicion)
+
+    # Step 5: final blended score
+    alpha = get_familiarity_alpha(familiarity_score, snap)
+    final_score = max(0, min(100, community_score +
+                             alpha * (engine_score - community_score)))
+
+    player.rank_score = rank_score
+    player.stats_score = stats_score
+    player.community_score = community_score
+    player.familiarity_score = familiarity_score
+    player.smurf_suspicion_score = suspicion
+    player.engine_score = engine_score
+    player.final_skill_score = final_score
+
+
+@lru_cache(maxsize=4096)
+def _scores_from_stats(version: int, rank_current: str, rank_peak: str,
+                       kd_ratio, acs, win_rate, headshot_rate,
+                       admin_skill, admin_familiarity,
+                       account_level, total_matches) -> tuple:
+    """
+    Run the fused pipeline once per distinct raw-stat line.
+
+    Duplicate stat lines in a roster — and the same roster re-scored
+    across seed sweeps in one process — hit the cache instead of
+    redoing the arithmetic. Keyed on the config version like the other
+    scoring caches.
+    """
+    probe = Player(
+        player_id='', player_name='',
+        rank_current=rank_current, rank_peak_recent=rank_peak,
+        kd_ratio=kd_ratio, average_combat_score=acs,
+        win_rate=win_rate, headshot_rate=headshot_rate,
+        admin_skill_rating=admin_skill, admin_familiarity=admin_familiarity,
+        account_level=account_level, total_ranked_matches=total_matches)
+    _compute_all_scores_fused(probe, _snapshot(version))
+    return (probe.rank_group, probe.rank_group_id, probe.rank_score,
+            probe.stats_score, probe.community_score, probe.familiarity_score,
+            probe.smurf_suspicion_score, probe.engine_score,
+            probe.final_skill_score, probe.is_smurf_suspected)
+
+
+def compute_all_scores(player: Player, snap: Optional[_ConfigSnapshot] = None) -> None:
     """
     Compute all rating components for a player and update the Player object.
     This is the main entry point for rating a player.
+
+    Memoized per distinct raw-stat line via _scores_from_stats; the
+    snap argument stays for batch callers, but the memo key already
+    pins the config version.
+    """
+    (player.rank_group, player.rank_group_id, player.rank_score,
+     player.stats_score, player.community_score, player.familiarity_score,
+     player.smurf_suspicion_score, player.engine_score,
+     player.final_skill_score, player.is_smurf_suspected) = _scores_from_stats(
+        config.CONFIG_VERSION,
+        player.rank_current, player.rank_peak_recent, player.kd_ratio,
+        player.average_combat_score, player.win_rate, player.headshot_rate,
+        player.admin_skill_rating, player.admin_familiarity,
+        player.account_level, player.total_ranked_matches)
+
+
+def compute_all_scores_batch(players: list[Player]) -> None:
+    """
+    Score an entire roster in one pass.
+
+    Resolves the config snapshot once for the whole batch instead of once
+    per player, so roster-sized scoring runs pay the lookup cost a single
+    time.
+
+    Deliberately sequential: the pipeline is pure Python and GIL-bound,
+    so a thread pool only adds scheduling overhead at tournament sizes.
+    Process-level parallelism lives where it pays off, in the
+    optimizer's restart loop.
     """
-    # Step 1: Determine rank group (needed for stats normalization)
-    player.rank_group = get_rank_group(player.rank_current)
-    
-    # Step 2: Compute individual components
-    player.rank_score = compute_rank_score(player)
-    player.stats_score = compute_stats_score(player)
-    player.community_score, player.familiarity_score = compute_community_score_and_familiarity(player)
-    
-    # Step 3: Compute smurf suspicion (must be done before engine score)
-    player.smurf_suspicion_score = compute_smurf_suspicion(player)
-    
-    # Step 4: Compute engine score (rank + stats with dynamic clamp based on suspicion)
-    player.engine_score = compute_engine_score(player)
-    
-    # Step 5: Compute final blended score
-    player.final_skill_score = compute_final_skill_score(player)
+    snap = _current_snapshot()
+    for player in players:
+        compute_all_scores(player, snap)
@@ -1,186 +1,212 @@
 """Smurf detection for team balancing system."""
 
+from typing import Optional
+
 from src.models import Player
 from src.config import get_config
 
 
-def compute_smurf_suspicion(player: Player) -> float:
+# Integer ids for the rank groups; used to index the tuple tables below
+# so the hot path does C-level tuple indexing instead of string-keyed
+# dict probes and repeated string compares
+_RG_LOW, _RG_MID, _RG_HIGH = 0, 1, 2
+_GROUP_IDS = {"low": _RG_LOW, "mid": _RG_MID, "high": _RG_HIGH}
+
+# Per-group caps: (ACS Cap, KD Cap, HS% Cap)
+_THRESH_TBL = (
+    (240, 1.15, 25.0),  # low:  Iron - Gold (easy to spot smurfs)
+    (260, 1.25, 30.0),  # mid:  Plat - Diamond
+    (290, 1.35, 35.0),  # high: Ascendant+ (hard to trigger)
+)
+
+# Expected admin rating per group (criterion 6c):
+# Iron-Gold ~2-5/10, Plat-Dia ~4-7/10, Asc+ ~6-10/10
+_EXPECTED_ADMIN = (3.5, 5.5, 7.5)
+
+# Admin-mismatch ladder (criteria 6a/6b), flattened to a table indexed
+# by [rank_group_id][admin skill band] where the bands are
+# 0: admin <= 4, 1: admin 5-6, 2: admin >= 7. Each rule row is
+# (base, familiarity bonus by band 0-3, KD>1.0 bonus); None falls
+# through to the 6c gap formula.
+_RULE_6A = (50.0, (0.0, 0.0, 0.0, 20.0), 0.0)   # Hidden Gem: low rank, high admin
+_RULE_6B = (45.0, (0.0, 0.0, 15.0, 30.0), 10.0)  # Account Share: mid/high rank, low admin
+_ADMIN_RULES = (
+    (None, None, _RULE_6A),      # low
+    (_RULE_6B, None, None),      # mid
+    (_RULE_6B, None, None),      # high
+)
+
+
+def compute_smurf_suspicion(player: Player, smurf_config: Optional[dict] = None) -> float:
     """
     Compute smurf suspicion score based on account metadata and performance stats.
-    
+
     ADVANCED LOGIC - Context-Aware Detection:
     1. High Elo Immunity: Immortals/Radiants are rarely 'smurfs', just good players.
     2. Dynamic Thresholds: A 1.2 KD is normal in Ascendant, but suspicious in Silver.
     3. The 'Sleeper' Detection: Old accounts with sudden god-like stats (Boosting).
     4. Peak vs Current: Detecting derankers.
-    
+
     Returns suspicion score from 0 to 100.
     """
-    smurf_config = get_config("smurf_config", {})
+    # Callers scoring a batch pass the smurf_config section from their
+    # config snapshot; standalone calls fall back to the live config
+    if smurf_config is None:
+        smurf_config = get_config("smurf_config", {})
+
+    # Load every player field once up front; the cascade below is pure
+    # arithmetic on these locals, with a single write-back at the end
+    rank_current = player.rank_current
+    # Resolve the group string to its integer id once; every later group
+    # check is then an int compare. Written back so downstream consumers
+    # see a rank_group_id consistent with rank_group.
+    rank_group_id = _GROUP_IDS.get(player.rank_group, _RG_MID)
+    player.rank_group_id = rank_group_id
+    kd_ratio = player.kd_ratio
+    acs = player.average_combat_score
+    headshot_rate = player.headshot_rate
+    account_level = player.account_level
+    total_matches = player.total_ranked_matches
+    win_rate = player.win_rate
+    admin_skill = player.admin_skill_rating
+    admin_familiarity = player.admin_familiarity
+
     suspicion = 0.0
-    
+
     # === LOGIC 1: HIGH ELO IMMUNITY ===
     # If player is already Immortal+, they are at the correct rank.
     # High stats there just mean they are carrying, not smurfing in the unfair sense.
     is_high_elo = False
     # Check rank_current string for high elo keywords
-    if player.rank_current and ("Immortal" in player.rank_current or "Radiant" in player.rank_current):
+    if rank_current and ("Immortal" in rank_current or "Radiant" in rank_current):
         is_high_elo = True
-    
+
     # If High Elo, we drastically reduce sensitivity. Only flag EXTREME anomalies.
     suspicion_multiplier = 0.3 if is_high_elo else 1.0
 
     # === LOGIC 2: DYNAMIC THRESHOLDS BY RANK ===
-    # Define what is considered "Suspiciously Good" for each rank group
-    
-    # Thresholds: (ACS Cap, KD Cap, HS% Cap)
-    thresholds = {
-        "low":  (240, 1.15, 25.0),  # Iron - Gold: Low cap (easy to spot smurfs)
-        "mid":  (260, 1.25, 30.0),  # Plat - Diamond: Medium cap
-        "high": (290, 1.35, 35.0)   # Ascendant+: High cap (hard to trigger)
-    }
-    
-    # Get thresholds for player's rank group (default to mid if unknown)
-    t_acs, t_kd, t_hs = thresholds.get(player.rank_group, (260, 1.25, 30.0))
-    
+    # "Suspiciously Good" caps for the player's rank group (unknown
+    # groups resolved to mid above)
+    t_acs, t_kd, t_hs = _THRESH_TBL[rank_group_id]
+
+    # Shared by the stat factors here and the win-rate combination check
+    # further down, so each compare happens exactly once
+    acs_over = acs is not None and acs > t_acs
+    kd_over = kd_ratio > t_kd
+
     # --- Check ACS ---
-    if player.average_combat_score is not None:
-        if player.average_combat_score > t_acs:
-            excess = player.average_combat_score - t_acs
-            # In low elo, every point above threshold is VERY suspicious
-            severity = 1.5 if player.rank_group == "low" else 1.0
-            suspicion += min(excess * 0.8 * severity, 40.0)
+    if acs_over:
+        excess = acs - t_acs
+        # In low elo, every point above threshold is VERY suspicious
+        severity = 1.5 if rank_group_id == _RG_LOW else 1.0
+        suspicion += min(excess * 0.8 * severity, 40.0)
 
     # --- Check K/D ---
-    if player.kd_ratio > t_kd:
-        excess = player.kd_ratio - t_kd
+    if kd_over:
+        excess = kd_ratio - t_kd
         # 0.1 KD above threshold = 10 points suspicion
         suspicion += min(excess * 100, 35.0)
 
     # --- Check HS% (Mechanical Skill) ---
-    if player.headshot_rate is not None and player.headshot_rate > t_hs:
-        excess = player.headshot_rate - t_hs
+    if headshot_rate is not None and headshot_rate > t_hs:
+        excess = headshot_rate - t_hs
         suspicion += min(excess * 1.5, 25.0)
 
     # === LOGIC 3: THE "SLEEPER" / BOOSTING DETECTOR ===
     # Case: High Level Account + Low Rank + God Stats
     # This detects when a friend plays on a hardstuck account
-    if player.account_level and player.account_level > 100:
-        if player.rank_group == "low" or player.rank_group == "mid":
+    if account_level and account_level > 100:
+        if rank_group_id != _RG_HIGH:
             # If they have stats exceeding the NEXT tier's threshold
-            next_tier_acs = thresholds["high"][0] # 290
-            if player.average_combat_score and player.average_combat_score > next_tier_acs:
+            next_tier_acs = _THRESH_TBL[_RG_HIGH][0] # 290
+            if acs and acs > next_tier_acs:
                 suspicion += 30.0 # Massive penalty for being a "sleeper"
 
     # === LOGIC 4: PEAK VS CURRENT (The Deranker) ===
     # If Peak was Immortal but Current is Diamond/Plat -> Suspect
     # (Simplified check based on text analysis of rank string if available, or admin input)
     # Here we rely on stats: if stats are high AND rank is lower than peak likely implies smurfing
-    
+
     # ... (Existing Admin Logic below) ...
-    
+
     # Factor: Low account level (Classic Smurf)
     # Only apply if NOT High Elo (a new account in Immortal is just a fast climber)
-    if player.account_level is not None and not is_high_elo:
+    if account_level is not None and not is_high_elo:
         level_threshold = smurf_config.get("low_account_level_threshold", 50)
-        if player.account_level < level_threshold:
-            level_ratio = 1.0 - (player.account_level / level_threshold)
+        if account_level < level_threshold:
+            level_ratio = 1.0 - (account_level / level_threshold)
             suspicion += level_ratio * 25.0
-    
+
     # Factor: Low match count
-    if player.total_ranked_matches is not None:
+    if total_matches is not None:
         match_threshold = 80
-        if player.total_ranked_matches < match_threshold:
-            match_ratio = 1.0 - (player.total_ranked_matches / match_threshold)
+        if total_matches < match_threshold:
+            match_ratio = 1.0 - (total_matches / match_threshold)
             suspicion += match_ratio * 15.0
 
     # Apply High Elo Immunity Multiplier
     suspicion *= suspicion_multiplier
-    
+
     # Factor: High win rate COMBINED with good stats = boosting/smurfing
-    if player.win_rate is not None and player.win_rate > 55.0:
+    if win_rate is not None and win_rate > 55.0:
         # Win rate alone isn't suspicious, but combined with elevated stats...
-        # Re-calculate stats_above_expected locally since we changed the logic flow
-        stats_flags = 0
-        if player.average_combat_score and player.average_combat_score > t_acs: stats_flags += 1
-        if player.kd_ratio > t_kd: stats_flags += 1
-        
-        if stats_flags >= 1:
-            winrate_excess = player.win_rate - 55.0
+        if acs_over or kd_over:
+            winrate_excess = win_rate - 55.0
             max_excess = 20.0  # 75% winrate = max
             winrate_ratio = min(winrate_excess / max_excess, 1.0)
             # Moderate contribution, only when combined with stat anomalies
             winrate_suspicion = winrate_ratio * 15.0
             suspicion += winrate_suspicion
-    
+
+    # Already past the clamp ceiling: the admin ladder can only add, and
+    # the anti-false-positive damping below can't fire at this magnitude
+    # (it needs sub-threshold KD and ACS, which can't reach 100 alone)
+    if suspicion >= 100.0:
+        player.is_smurf_suspected = 100.0 >= smurf_config.get("suspicion_threshold", 40.0)
+        return 100.0
+
     # Factor 6: Admin evaluation mismatches (The "Truth Serum")
-    if player.admin_skill_rating is not None:
-        admin_score = player.admin_skill_rating  # 0-10 scale
-        
-        # 6a: The "Hidden Gem" (Low Rank + High Admin Rating)
-        # Example: Silver player rated 8/10 by Admin -> Smurf/Underranked
-        if player.rank_group == "low" and admin_score >= 7:
-            # Admin says they are good, Rank says they are bad -> SMURF
-            base_suspicion = 50.0
-            # If Admin knows them well (Familiarity 3), trust the admin even more
-            if player.admin_familiarity and player.admin_familiarity >= 3:
-                base_suspicion += 20.0  # 70 total
-            suspicion += base_suspicion
-            
-        # 6b: The "Account Share" / "Boosted" (High Rank/Stats + Low Admin Rating)
-        # Example: Ascendant player rated 4/10 by Admin
-        # User scenario: "ce compte a été smurfé par quelqu'un" (someone else played on it)
-        # Stats might be high (from the smurf), but Admin knows the real player is weak.
-        elif player.rank_group in ["mid", "high"] and admin_score <= 4:
-            # If stats are actually good (supporting the high rank), but Admin says NO.
-            # This implies the stats are FAKE (achieved by a smurf).
-            base_suspicion = 45.0
-            
-            # Stronger penalty if Admin knows them well (more confidence in the rating)
-            if player.admin_familiarity and player.admin_familiarity >= 3:
-                base_suspicion += 30.0  # 75 total - Very suspicious
-            elif player.admin_familiarity and player.admin_familiarity >= 2:
-                base_suspicion += 15.0  # 60 total - Moderately suspicious
-            
+    # 6a "Hidden Gem" (low rank + high admin) and 6b "Account Share"
+    # (mid/high rank + low admin) live in _ADMIN_RULES; everything else
+    # falls through to the 6c gap formula.
+    if admin_skill is not None:
+        admin_score = admin_skill  # 0-10 scale
+        skill_band = 0 if admin_score <= 4 else (2 if admin_score >= 7 else 1)
+        rule = _ADMIN_RULES[rank_group_id][skill_band]
+
+        if rule is not None:
+            base_suspicion, fam_bonus, kd_bonus = rule
+            # The more familiar the admin, the more their verdict counts
+            fam_band = min(admin_familiarity, 3) if admin_familiarity else 0
+            base_suspicion += fam_bonus[fam_band]
             # Additional penalty if stats are good (someone else played)
-            if player.kd_ratio > 1.0:
-                base_suspicion += 10.0
-            
+            if kd_bonus and kd_ratio > 1.0:
+                base_suspicion += kd_bonus
             suspicion += base_suspicion
-        
+
         # 6c: Moderate Admin Mismatch (Any rank group with significant admin disagreement)
         # This catches cases where admin rating doesn't match rank expectations
         else:
-            # Calculate expected admin rating based on rank
-            expected_admin_by_rank = {
-                "low": 3.5,   # Iron-Gold should be rated 2-5/10
-                "mid": 5.5,   # Plat-Dia should be rated 4-7/10
-                "high": 7.5   # Asc+ should be rated 6-10/10
-            }
-            expected_admin = expected_admin_by_rank.get(player.rank_group, 5.5)
+            expected_admin = _EXPECTED_ADMIN[rank_group_id]
             admin_gap = abs(admin_score - expected_admin)
-            
+
             # If gap > 2 points and Admin knows them well, add moderate suspicion
-            if admin_gap > 2.0 and player.admin_familiarity and player.admin_familiarity >= 3:
+            if admin_gap > 2.0 and admin_familiarity and admin_familiarity >= 3:
                 gap_suspicion = min(admin_gap * 10, 25.0)
                 suspicion += gap_suspicion
-    
+
     # === CRITICAL: Anti-false-positive for genuinely weak players ===
-    # If BOTH K/D < 0.85 AND ACS is below expected, drastically reduce suspicion
-    # This prevents flagging true low-skill players
+    # If BOTH K/D < 0.85 AND ACS is below expected (t_acs), reduce
+    # suspicion by 70% to avoid flagging true low-skill players.
     # EXCEPTION: If Admin flagged them as "Hidden Gem" (6a), DO NOT reduce suspicion!
-    is_admin_flagged = (player.admin_skill_rating is not None and player.admin_skill_rating >= 7)
-    
-    if player.kd_ratio < 0.85 and not is_admin_flagged:
-        # Use t_acs (threshold acs) as the baseline for expected performance
-        if player.average_combat_score and player.average_combat_score < t_acs:
-            suspicion *= 0.3  # Reduce by 70%
-    
-    # Clamp to valid range
-    suspicion = max(0.0, min(100.0, suspicion))
-    
+    is_admin_flagged = admin_skill is not None and admin_skill >= 7
+    damp = (0.3 if kd_ratio < 0.85 and not is_admin_flagged and acs and acs < t_acs
+            else 1.0)
+
+    # Damp and clamp to the valid range in one expression
+    suspicion = max(0.0, min(100.0, suspicion * damp))
+
     # Update player flags (lower threshold = more sensitive detection)
-    suspicion_threshold = smurf_config.get("suspicion_threshold", 40.0)  # Lowered from 50
-    player.is_smurf_suspected = suspicion >= suspicion_threshold
-    
+    player.is_smurf_suspected = suspicion >= smurf_config.get("suspicion_threshold", 40.0)
+
     return suspicion
@@ -5,11 +5,80 @@ Handles loading player data from JSON, saving team configurations to JSON/text f
 """
 
 import json
-from typing import List
+import os
+import sys
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, List
+
+try:
+    import orjson  # optional accelerator: Rust parser, several times faster
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: incremental parsing for very large rosters
+except ImportError:
+    ijson = None
+
+# Roster files above this size are parsed incrementally (when ijson is
+# available) instead of being materialized as one document tree
+_STREAMING_THRESHOLD_BYTES = 10_000_000
 
 from .models import Player, TeamConfiguration
 
 
+# Required roster fields, extracted with one C-level call per entry; the
+# optional fields fall back to None via dict.get. Both orders mirror the
+# positional layout of the Player dataclass.
+_required_fields = itemgetter('player_name', 'rank_current', 'rank_peak_recent', 'kd_ratio')
+_OPTIONAL_FIELDS = (
+    'average_combat_score',
+    'win_rate',
+    'headshot_rate',
+    'admin_skill_rating',
+    'admin_familiarity',
+    'account_level',
+    'total_ranked_matches',
+    'ranked_matches_last_30_days',
+)
+
+
+def _build_player(idx: int, p_data: dict) -> Player:
+    """Build a Player from one roster entry (0-based position idx)."""
+    name, rank_current, rank_peak, kd_ratio = _required_fields(p_data)
+    get = p_data.get
+    return Player(
+        get('player_id', f'player{idx+1:03d}'),
+        # Interned: names are reused as dict/set keys (name index,
+        # lookups), so hashing/equality collapse to pointer checks
+        sys.intern(name),
+        rank_current,
+        rank_peak,
+        kd_ratio,
+        *(get(key) for key in _OPTIONAL_FIELDS),
+    )
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed and stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to 2-space-indented UTF-8 JSON bytes (orjson when installed).
+
+    Returning bytes lets callers write binary-mode files directly,
+    skipping the decode/re-encode round trip orjson output would
+    otherwise take through a text-mode handle.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 def load_players_from_json(filepath: str) -> List[Player]:
     """
     Load players from a JSON file.
@@ -47,9 +116,25 @@ def load_players_from_json(filepath: str) -> List[Player]:
         json.JSONDecodeError: If JSON is malformed
         KeyError: If required fields are missing
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
+    # Streaming path for large rosters: build each Player as its entry
+    # is parsed, so the intermediate dicts never accumulate into a full
+    # document tree. Only worth it past ~10 MB — below that the
+    # whole-document parse is faster and the peak-memory saving is noise.
+    if ijson is not None and os.path.getsize(filepath) > _STREAMING_THRESHOLD_BYTES:
+        with open(filepath, 'rb') as f:
+            # Peek at the first non-whitespace byte (skipping any BOM) to
+            # pick between the {'players': [...]} and bare-list formats
+            head = f.read(16).lstrip(b'\xef\xbb\xbf \t\r\n')
+            prefix = 'players.item' if head.startswith(b'{') else 'item'
+            f.seek(0)
+            return [_build_player(idx, p_data)
+                    for idx, p_data in enumerate(ijson.items(f, prefix))]
+
+    # Read as bytes: orjson parses bytes directly, and stdlib json
+    # accepts them too
+    with open(filepath, 'rb') as f:
+        data = json_loads(f.read())
+
     # Support both formats: {"players": [...]} and [...]
     if isinstance(data, dict) and 'players' in data:
         player_list = data['players']
@@ -57,27 +142,8 @@ def load_players_from_json(filepath: str) -> List[Player]:
         player_list = data
     else:
         raise ValueError("Invalid JSON format: expected {'players': [...]} or [...]")
-    
-    players = []
-    for idx, p_data in enumerate(player_list):
-        player = Player(
-            player_id=p_data.get('player_id', f'player{idx+1:03d}'),
-            player_name=p_data['player_name'],
-            rank_current=p_data['rank_current'],
-            rank_peak_recent=p_data['rank_peak_recent'],
-            kd_ratio=p_data['kd_ratio'],
-            average_combat_score=p_data.get('average_combat_score'),
-            win_rate=p_data.get('win_rate'),
-            headshot_rate=p_data.get('headshot_rate'),
-            admin_skill_rating=p_data.get('admin_skill_rating'),
-            admin_familiarity=p_data.get('admin_familiarity'),
-            account_level=p_data.get('account_level'),
-            total_ranked_matches=p_data.get('total_ranked_matches'),
-            ranked_matches_last_30_days=p_data.get('ranked_matches_last_30_days')
-        )
-        players.append(player)
-    
-    return players
+
+    return [_build_player(idx, p_data) for idx, p_data in enumerate(player_list)]
 
 
 def save_teams_to_json(config: TeamConfiguration, filepath: str) -> None:
@@ -132,8 +198,72 @@ def save_teams_to_json(config: TeamConfiguration, filepath: str) -> None:
         }
         output["teams"].append(team_data)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(json_dumps(output))
+
+
+# Rank-name abbreviations for the fixed-width text report
+_RANK_SHORTENINGS = {
+    'Ascendant': 'Asc',
+    'Immortal': 'Imm',
+    'Diamond': 'Dia',
+    'Platinum': 'Plat',
+    'Bronze': 'Brz',
+    'Silver': 'Slv',
+    'Radiant': 'Rad'
+}
+
+
+# Precompiled row template for the team table: %-formatting skips the
+# per-call format-spec parsing that f-strings/str.format redo per row.
+_ROW_TEMPLATE = (
+    "%-20s | %-22s | %5.2f | %4s | %5s | %5s | %4s | %4s | "
+    "%4.0f | %4.0f | %4.0f | %6s | %5.1f\n"
+)
+
+# The header is fully static, so render it once at import
+_HEADER_ROW = (
+    f"{'Player':20s} | {'Rank (Cur->Peak)':22s} | {'KD':>5s} | {'ACS':>4s} | "
+    f"{'WR%':>5s} | {'HS%':>5s} | {'Lvl':>4s} | {'Mat':>4s} | {'R':>4s} | "
+    f"{'S':>4s} | {'C':>4s} | {'Smurf':>6s} | {'Final':>5s}\n"
+)
+
+
+def _fmt_opt(value: Any, spec: str, width: int) -> str:
+    """Format an optional stat; right-aligned '--' when missing."""
+    return format(value, spec) if value is not None else '--'.rjust(width)
+
+
+@lru_cache(maxsize=64)
+def _shorten_rank_slow(rank: str) -> str:
+    """Replace-chain fallback for rank strings outside the ladder table.
+
+    Cached: a tournament reuses the same handful of rank strings, so the
+    chain runs once per distinct rank instead of twice per row.
+    """
+    for full, short in _RANK_SHORTENINGS.items():
+        rank = rank.replace(full, short)
+    return rank
+
+
+# Every ladder "<Rank> <tier>" combination pre-shortened (including the
+# unabbreviated Iron/Gold tiers and tierless Radiant), so the common
+# case is a single dict hit with zero string scans. Anything else —
+# "300RR", typos — falls back to the cached replace chain.
+_SHORT_RANKS = {'Radiant': 'Rad'}
+for _full in ('Iron', 'Gold'):
+    for _tier in ('1', '2', '3'):
+        _SHORT_RANKS[f'{_full} {_tier}'] = f'{_full} {_tier}'
+for _full, _short in _RANK_SHORTENINGS.items():
+    for _tier in ('1', '2', '3'):
+        _SHORT_RANKS[f'{_full} {_tier}'] = f'{_short} {_tier}'
+del _full, _short, _tier
+
+
+def _shorten_rank(rank: str) -> str:
+    """Shorten rank names for better alignment."""
+    result = _SHORT_RANKS.get(rank)
+    return result if result is not None else _shorten_rank_slow(rank)
 
 
 def save_teams_to_txt_file(config: TeamConfiguration, output_file: str) -> None:
@@ -149,56 +279,63 @@ def save_teams_to_txt_file(config: TeamConfiguration, output_file: str) -> None:
         config: TeamConfiguration object with teams and stats
         output_file: Path where text file will be saved
     """
-    def shorten_rank(rank: str) -> str:
-        """Shorten rank names for better alignment."""
-        replacements = {
-            'Ascendant': 'Asc',
-            'Immortal': 'Imm',
-            'Diamond': 'Dia',
-            'Platinum': 'Plat',
-            'Bronze': 'Brz',
-            'Silver': 'Slv',
-            'Radiant': 'Rad'
-        }
-        for full, short in replacements.items():
-            rank = rank.replace(full, short)
-        return rank
-    
     num_teams = len(config.teams)
     team_size = len(config.teams[0]) if config.teams else 0
     total_players = sum(len(team) for team in config.teams)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("="*80 + "\n")
-        f.write("VALORANT TOURNAMENT - BALANCED TEAMS\n")
-        f.write("="*80 + "\n\n")
-        
-        f.write(f"Number of Teams: {num_teams}\n")
-        f.write(f"Team Size: {team_size}\n")
-        f.write(f"Total Players: {total_players}\n")
-        f.write(f"Average Team Skill: {config.average_team_skill:.2f}\n")
-        f.write(f"Fairness Score (lower = better): {config.fairness_score:.2f}\n\n")
-        
-        # Team details
-        for i, team in enumerate(config.teams, 1):
-            team_total = config.team_total_skills[i-1]
-            deviation = team_total - config.average_team_skill
-            
-            f.write("="*158 + "\n")
-            f.write(f"\nTeam {i} (Total Skill: {team_total:.2f}, Deviation: {deviation:+.2f})\n")
-            f.write("=" * 158 + "\n")
-            f.write(f"{'Player':20s} | {'Rank (Cur->Peak)':22s} | {'KD':>5s} | {'ACS':>4s} | {'WR%':>5s} | {'HS%':>5s} | {'Lvl':>4s} | {'Mat':>4s} | {'R':>4s} | {'S':>4s} | {'C':>4s} | {'Smurf':>6s} | {'Final':>5s}\n")
-            f.write("-" * 158 + "\n")
-            
-            for player in team:
-                rank_display = f"{shorten_rank(player.rank_current)}->{shorten_rank(player.rank_peak_recent)}"
-                acs_display = f"{player.average_combat_score:4.0f}" if player.average_combat_score is not None else "  --"
-                wr_display = f"{player.win_rate:5.1f}" if player.win_rate is not None else "   --"
-                hs_display = f"{player.headshot_rate:5.1f}" if player.headshot_rate is not None else "   --"
-                lvl_display = f"{player.account_level:4d}" if player.account_level is not None else "  --"
-                mts_display = f"{player.total_ranked_matches:4d}" if player.total_ranked_matches is not None else "  --"
-                smurf_display = f"{player.smurf_suspicion_score:5.0f}{'!' if player.is_smurf_suspected else ' '}"
-                
-                f.write(f"{player.player_name:20s} | {rank_display:22s} | {player.kd_ratio:5.2f} | {acs_display:>4s} | {wr_display:>5s} | {hs_display:>5s} | {lvl_display:>4s} | {mts_display:>4s} | {player.rank_score:4.0f} | {player.stats_score:4.0f} | {player.community_score:4.0f} | {smurf_display:>6s} | {player.final_skill_score:5.1f}\n")
-        
-        f.write("\n" + "="*80 + "\n")
+
+    # Buffer the whole report and write it once: a single encode and
+    # syscall instead of one per fragment
+    out = []
+    write = out.append
+
+    write("="*80 + "\n")
+    write("VALORANT TOURNAMENT - BALANCED TEAMS\n")
+    write("="*80 + "\n\n")
+
+    write(f"Number of Teams: {num_teams}\n")
+    write(f"Team Size: {team_size}\n")
+    write(f"Total Players: {total_players}\n")
+    write(f"Average Team Skill: {config.average_team_skill:.2f}\n")
+    write(f"Fairness Score (lower = better): {config.fairness_score:.2f}\n\n")
+
+    # Materialize each player's display tuple in one attribute-access
+    # pass; the write loop below then works off plain tuples that slot
+    # straight into the row template
+    team_rows = [
+        [(player.player_name,
+          f"{_shorten_rank(player.rank_current)}->{_shorten_rank(player.rank_peak_recent)}",
+          player.kd_ratio,
+          _fmt_opt(player.average_combat_score, '4.0f', 4),
+          _fmt_opt(player.win_rate, '5.1f', 5),
+          _fmt_opt(player.headshot_rate, '5.1f', 5),
+          _fmt_opt(player.account_level, '4d', 4),
+          _fmt_opt(player.total_ranked_matches, '4d', 4),
+          player.rank_score,
+          player.stats_score,
+          player.community_score,
+          f"{player.smurf_suspicion_score:5.0f}{'!' if player.is_smurf_suspected else ' '}",
+          player.final_skill_score)
+         for player in team]
+        for team in config.teams
+    ]
+
+    # Team details (totals and average bound once outside the loop)
+    avg_skill = config.average_team_skill
+    for i, (rows, team_total) in enumerate(zip(team_rows, config.team_total_skills), 1):
+        deviation = team_total - avg_skill
+
+        write("="*158 + "\n")
+        write(f"\nTeam {i} (Total Skill: {team_total:.2f}, Deviation: {deviation:+.2f})\n")
+        write("=" * 158 + "\n")
+        write(_HEADER_ROW)
+        write("-" * 158 + "\n")
+
+        for row in rows:
+            write(_ROW_TEMPLATE % row)
+
+    write("\n" + "="*80 + "\n")
+
+    # One bulk encode + binary write skips the TextIOWrapper's
+    # incremental encoder; UTF-8 keeps non-ASCII player names intact
+    with open(output_file, 'wb') as f:
+        f.write(''.join(out).encode('utf-8'))
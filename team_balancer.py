@@ -16,7 +16,7 @@ from src import (
     load_players_from_json,
     save_teams_to_json,
     save_teams_to_txt_file,
-    compute_all_scores,
+    compute_all_scores_batch,
     generate_balanced_teams
 )
 
@@ -29,6 +29,7 @@ def main():
     parser.add_argument('--teams', type=int, default=8, help='Number of teams')
     parser.add_argument('--size', type=int, default=5, help='Players per team')
     parser.add_argument('--iterations', type=int, default=5000, help='Optimization iterations')
+    parser.add_argument('--restarts', type=int, default=1, help='Parallel optimization restarts (best result kept)')
     parser.add_argument('--seed', type=int, help='Random seed')
     parser.add_argument('--quiet', action='store_true', help='Suppress output')
     
@@ -65,8 +66,7 @@ def main():
     
     if not args.quiet:
         print("Computing player scores...")
-    for player in players:
-        compute_all_scores(player)
+    compute_all_scores_batch(players)
     
     try:
         config = generate_balanced_teams(
@@ -74,7 +74,8 @@ def main():
             num_teams=args.teams,
             team_size=args.size,
             num_iterations=args.iterations,
-            verbose=not args.quiet
+            verbose=not args.quiet,
+            num_restarts=args.restarts
         )
         
         if not args.quiet:
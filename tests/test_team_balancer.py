@@ -1,3 +1,4 @@
+import ast
 import unittest
 import json
 from src import (
@@ -106,6 +107,67 @@ class TestTeamBalancer(unittest.TestCase):
         suspicion_6c = compute_smurf_suspicion(new_impressive)
         self.assertGreater(suspicion_6c, 10.0)  # Should trigger 6c
 
+    def test_smurf_suspicion_single_definition(self):
+        # Guard against a second def compute_smurf_suspicion silently
+        # shadowing the advanced implementation
+        with open('src/smurf_detection.py') as f:
+            tree = ast.parse(f.read())
+        definitions = [node for node in tree.body
+                       if isinstance(node, ast.FunctionDef)
+                       and node.name == 'compute_smurf_suspicion']
+        self.assertEqual(len(definitions), 1)
+
+    def test_admin_ladder_matches_reference(self):
+        # Replay the original 6a/6b/6c branch ladder against the
+        # table-driven implementation across the full decision grid
+        def reference_admin_suspicion(rank_group, admin_score, fam, kd):
+            if rank_group == "low" and admin_score >= 7:
+                base = 50.0
+                if fam and fam >= 3:
+                    base += 20.0
+                return base
+            elif rank_group in ["mid", "high"] and admin_score <= 4:
+                base = 45.0
+                if fam and fam >= 3:
+                    base += 30.0
+                elif fam and fam >= 2:
+                    base += 15.0
+                if kd > 1.0:
+                    base += 10.0
+                return base
+            else:
+                expected = {"low": 3.5, "mid": 5.5, "high": 7.5}[rank_group]
+                gap = abs(admin_score - expected)
+                if gap > 2.0 and fam and fam >= 3:
+                    return min(gap * 10, 25.0)
+                return 0.0
+
+        for rank_group in ("low", "mid", "high"):
+            for admin_score in range(0, 11):
+                for fam in (None, 1, 2, 3):
+                    for kd in (0.9, 1.1):
+                        # Neutral stats so only the admin ladder contributes
+                        player = Player(
+                            player_id="x",
+                            player_name="LadderProbe",
+                            rank_current="Gold 1",
+                            rank_peak_recent="Gold 1",
+                            kd_ratio=kd,
+                            average_combat_score=200,
+                            win_rate=50.0,
+                            headshot_rate=20.0,
+                            admin_skill_rating=admin_score,
+                            admin_familiarity=fam,
+                            account_level=100,
+                            total_ranked_matches=200,
+                            rank_group=rank_group
+                        )
+                        expected = min(100.0, reference_admin_suspicion(
+                            rank_group, admin_score, fam, kd))
+                        self.assertAlmostEqual(
+                            compute_smurf_suspicion(player), expected,
+                            msg=(rank_group, admin_score, fam, kd))
+
     def test_compute_engine_score(self):
         # Test engine score calculation
         # Engine score = 0.6 * rank_score + 0.4 * stats_score
@@ -4,13 +4,75 @@ Scrapes player statistics from tracker.gg by simulating human browser behavior.
 """
 
 import asyncio
+import hashlib
 import json
 import re
 import random
+import time
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from urllib.parse import quote
-from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, BrowserContext, Page, TimeoutError as PlaywrightTimeout
+
+try:
+    import orjson  # optional accelerator: C-level encoder, emits bytes
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # optional: direct JSON API access without a browser
+except ImportError:
+    httpx = None
+
+
+# Patterns compiled once at import: the rank alternation in particular is
+# non-trivial to compile, and the extractors run these against every
+# scraped page (several times per player on the fallback paths)
+_RANK_NAMES = (
+    r'Radiant|Immortal [1-3]|Ascendant [1-3]|Diamond [1-3]|Platinum [1-3]|'
+    r'Gold [1-3]|Silver [1-3]|Bronze [1-3]|Iron [1-3]'
+)
+_RANK_RE = re.compile(f'({_RANK_NAMES})')
+
+# Resources the extractors never read, dropped at the network layer.
+# Documents, scripts, and xhr/fetch stay enabled so the stats JS still
+# runs; images, fonts, media, styling, and ad/analytics hosts are most
+# of the page weight and none of the data.
+_BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+_BLOCKED_URL_SNIPPETS = (
+    'doubleclick', 'googlesyndication', 'google-analytics',
+    'googletagmanager', 'adservice',
+)
+
+
+# Dead-profile markers probed as literal case variants: a handful of
+# C-level substring tests beat lowercasing the whole text first
+_PRIVATE_MARKERS = ('Profile is private', 'profile is private')
+_NOT_FOUND_MARKERS = ('Player not found', 'player not found',
+                      'Not Found', 'Not found', 'not found')
+
+
+async def _route_filter(route):
+    """Abort requests for blocked resource types and ad/tracking hosts."""
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(s in request.url for s in _BLOCKED_URL_SNIPPETS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Fallback extraction works in two steps: a C-level str.find for the
+# literal marker, then a value regex confined to a small window after it.
+# The old single patterns used '.*?' with DOTALL, which rescanned the
+# whole multi-megabyte document per alternation whenever the marker was
+# absent; find + a bounded window keeps the scan linear and local.
+_FALLBACK_WINDOW = 2048
+_STAT_FALLBACKS = {
+    'kd': ('title="K/D Ratio"', re.compile(r'class="value"[^>]*>(\d+\.\d+)')),
+    'acs': ('title="ACS"', re.compile(r'class="value"[^>]*>(\d+\.?\d*)')),
+    'winrate': ('title="Win %"', re.compile(r'class="value"[^>]*>(\d+\.?\d*)%')),
+    'headshot': ('title="Headshot %"', re.compile(r'class="value"[^>]*>(\d+\.?\d*)%')),
+}
 
 
 class TrackerScraperHuman:
@@ -18,17 +80,58 @@ class TrackerScraperHuman:
     
     BASE_URL = "https://tracker.gg/valorant/profile/riot"
     
-    def __init__(self, headless: bool = False, slow_mo: int = 100):
+    def __init__(self, headless: bool = False, slow_mo: int = 0,
+                 profile_dir: str = '.playwright-profile',
+                 cache_dir: Optional[str] = '.tracker_cache',
+                 cache_ttl: float = 3600.0):
         """
         Initialize the scraper with human-like settings
-        
+
         Args:
             headless: Run browser in headless mode (invisible)
-            slow_mo: Delay in milliseconds between actions (simulates human speed)
+            slow_mo: Delay in milliseconds before every browser action;
+                0 by default — humanization comes from the explicit
+                mouse move and jittered delays, not a blanket slowdown
+            profile_dir: On-disk browser profile reused across runs
+            cache_dir: Directory for cached scrape results keyed by
+                profile URL (None disables caching)
+            cache_ttl: Cache entry lifetime in seconds
         """
         self.headless = headless
         self.slow_mo = slow_mo
+        self.profile_dir = profile_dir
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
         self.players_data = []
+
+    def _cache_file(self, url: str) -> Optional[Path]:
+        """Cache path for a profile URL, or None when caching is off."""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return Path(self.cache_dir) / f'{key}.json'
+
+    def _cache_load(self, cache_file: Optional[Path]) -> Optional[Dict]:
+        """Return fresh cached stats, or None when absent/expired."""
+        if cache_file is None:
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.cache_ttl:
+                return json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _cache_store(self, cache_file: Optional[Path], stats: Dict) -> None:
+        """Write scraped stats to the cache (best effort)."""
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(stats, ensure_ascii=False),
+                                  encoding='utf-8')
+        except OSError as e:
+            print(f"  ⚠️  Could not cache result: {e}")
     
     def build_profile_url(self, player_name: str, tag: str) -> str:
         """
@@ -42,9 +145,10 @@ class TrackerScraperHuman:
             Encoded URL for tracker.gg profile
         """
         tag = tag.replace("#", "")
-        player_identifier = f"{player_name}#{tag}"
-        # quote() automatically encodes Unicode characters (Ｎｉｋｋｏ → %EF%BC%AE...)
-        encoded = quote(player_identifier, safe='')
+        # Encode name and tag separately with an explicit %23 between
+        # them, instead of concatenating with '#' only to percent-encode
+        # it again; quote() handles Unicode (Ｎｉｋｋｏ → %EF%BC%AE...)
+        encoded = f"{quote(player_name, safe='')}%23{quote(tag, safe='')}"
         return f"{self.BASE_URL}/{encoded}/overview"
     
     async def human_delay(self, min_ms: int = 500, max_ms: int = 1500):
@@ -62,29 +166,36 @@ class TrackerScraperHuman:
         try:
             # Wait for DOM to load (don't wait for all ads)
             await page.wait_for_load_state('domcontentloaded', timeout=20000)
-            
-            # Wait longer for JavaScript execution (especially in headless mode)
-            await asyncio.sleep(8)
-            
-            # Check if profile is private or not found
-            content = await page.content()
-            if 'profile is private' in content.lower():
-                return False
-            if 'not found' in content.lower() or 'player not found' in content.lower():
-                return False
-            
-            # Try to wait for profile header (with short timeout)
+
+            # Wait for a real readiness signal instead of a fixed sleep:
+            # the first stat value or the rank tile appearing means the
+            # profile JS has rendered
             try:
-                await page.wait_for_selector('.trn-profile__header, .valorant-profile, .profile-header', timeout=10000)
-            except:
-                # If header doesn't appear, continue anyway
-                print("  ⚠️  Header not found, but continuing...")
-            
-            # Additional delay for stats to load
-            await self.human_delay(2000, 3000)
-            
+                await page.wait_for_selector(
+                    '.stat .numbers .value, .valorant-rank-tile__value',
+                    timeout=15000
+                )
+            except PlaywrightTimeout:
+                # Stats never appeared: check for a private or missing
+                # profile before giving the extractors a chance anyway.
+                # The rendered body text is a fraction of the serialized
+                # HTML, and the markers are probed as literals instead
+                # of lowercasing the whole thing.
+                try:
+                    visible_text = await page.inner_text('body')
+                except Exception:
+                    visible_text = await page.content()
+                if any(m in visible_text for m in _PRIVATE_MARKERS):
+                    return False
+                if any(m in visible_text for m in _NOT_FOUND_MARKERS):
+                    return False
+                print("  ⚠️  Stats not detected, but continuing...")
+
+            # Tiny settle delay; the DOM is ready once the selector hits
+            await self.human_delay(200, 600)
+
             return True
-            
+
         except PlaywrightTimeout:
             print("  ⚠️  Timeout - profile took too long to load")
             return False
@@ -92,183 +203,147 @@ class TrackerScraperHuman:
             print(f"  ⚠️  Error during loading: {e}")
             return False
     
-    async def extract_text_from_selector(self, page: Page, selector: str, default: str = "") -> str:
-        """Safely extract text from a CSS selector"""
-        try:
-            element = await page.query_selector(selector)
-            if element:
-                text = await element.inner_text()
-                return text.strip()
-            return default
-        except Exception as e:
-            print(f"  ⚠️  Error extracting '{selector}': {e}")
-            return default
-    
-    async def extract_rank(self, page: Page) -> Tuple[str, str]:
+    # Mapping of stat names to tracker.gg search patterns
+    STAT_TITLES = {
+        'kd': ['K/D Ratio', 'K/D', 'KD'],
+        'acs': ['ACS'],
+        'winrate': ['Win %', 'Win Rate'],
+        'headshot': ['Headshot %', 'HS %'],
+    }
+
+    # Reverse index (lowercased tracker.gg title -> canonical stat name)
+    # built once, so matching a tile is a single dict probe instead of a
+    # nested scan over every title variant
+    _TITLE_TO_STAT = {title.lower(): stat
+                      for stat, titles in STAT_TITLES.items()
+                      for title in titles}
+
+    # One browser-side pass over the profile: query every field inside
+    # the real DOM and return a small JSON blob, instead of serializing
+    # the whole document to Python and regex-mining it
+    _EXTRACT_ALL_JS = """() => {
+        const text = el => (el && el.innerText ? el.innerText.trim() : '');
+
+        // Current rank: first rank-tile selector with a real rating
+        let rank = '';
+        for (const sel of ['.valorant-rank-tile__value', '.rank-text',
+                           '.rating-entry__rank-info .value',
+                           '[data-v-tooltip*="Rank"]']) {
+            const t = text(document.querySelector(sel));
+            if (t && t !== 'Unrated') { rank = t; break; }
+        }
+
+        // Peak rank: the tile whose label mentions "Peak Rating"
+        let peak = '';
+        for (const el of document.querySelectorAll(
+                '.rating-summary__label, .stat__label, .label, h3')) {
+            if (el.innerText && el.innerText.includes('Peak Rating')) {
+                const holder = el.closest('.rating-summary, .stat, section')
+                    || el.parentElement;
+                peak = text(holder && holder.querySelector(
+                    '.rating-entry__rank-info .value, .stat__value, .value'));
+                break;
+            }
+        }
+
+        // Account level: the highlighted stat labelled "Level"
+        let level = null;
+        for (const el of document.querySelectorAll('.stat__label')) {
+            if (el.innerText.trim() === 'Level') {
+                const m = text(el.parentElement.querySelector('.stat__value'))
+                    .match(/\\d+/);
+                if (m) level = parseInt(m[0], 10);
+                break;
+            }
+        }
+
+        // Matches played: "NNN Matches" in the overview header
+        const matchesText = text(document.querySelector('.matches'));
+        const matchesMatch = matchesText.match(/(\\d+)/);
+        const matches = matchesMatch ? parseInt(matchesMatch[1], 10) : null;
+
+        // All stat tiles in one walk
+        const stats = {};
+        document.querySelectorAll('.stat .numbers').forEach(el => {
+            const n = el.querySelector('.name');
+            const v = el.querySelector('.value');
+            if (n && v) {
+                stats[(n.getAttribute('title') || n.innerText).trim()] =
+                    v.innerText.trim();
+            }
+        });
+
+        return { rank, peak, level, matches, stats };
+    }"""
+
+    async def get_fallback_html(self, page: Page) -> str:
         """
-        Extract current rank and peak rank.
-        
-        Returns:
-            Tuple of (current_rank, peak_rank)
+        Serialize only the profile region for the regex fallbacks.
+
+        The rank tiles and stat elements all live under the app root;
+        grabbing that subtree moves a fraction of the bytes of a full
+        page.content() call, which also drags along the head, inline
+        scripts, and ad markup the fallbacks never match.
         """
-        # Try different selectors for current rank
-        selectors_current = [
-            '.valorant-rank-tile__value',
-            '.rank-text',
-            '.rating-entry__rank-info .value',
-            '[data-v-tooltip*="Rank"]'
-        ]
-        
-        current_rank = ""
-        for selector in selectors_current:
-            rank_text = await self.extract_text_from_selector(page, selector)
-            if rank_text and rank_text != "Unrated":
-                # Clean up text (remove "Rating", newlines, etc.)
-                rank_text = rank_text.replace("Rating", "").replace("\n", " ").strip()
-                current_rank = rank_text
-                break
-        
-        # If not found, search in page content with regex
-        if not current_rank:
-            content = await page.content()
-            # Pattern: "Gold 2", "Platinum 1", etc.
-            rank_match = re.search(
-                r'(Radiant|Immortal [1-3]|Ascendant [1-3]|Diamond [1-3]|Platinum [1-3]|Gold [1-3]|Silver [1-3]|Bronze [1-3]|Iron [1-3])', 
-                content
-            )
-            if rank_match:
-                current_rank = rank_match.group(1)
-        
-        # Clean up multiple spaces
-        current_rank = " ".join(current_rank.split())
-        
-        # Extract peak rank
-        peak_rank = current_rank  # Default to current rank
         try:
-            # Look for "Peak Rating" section
-            content = await page.content()
-            peak_match = re.search(
-                r'Peak Rating.*?(Radiant|Immortal [1-3]|Ascendant [1-3]|Diamond [1-3]|Platinum [1-3]|Gold [1-3]|Silver [1-3]|Bronze [1-3]|Iron [1-3])',
-                content,
-                re.DOTALL
-            )
-            if peak_match:
-                peak_rank = peak_match.group(1)
+            return await page.eval_on_selector(
+                'main, .trn-profile, #app', 'el => el.outerHTML')
+        except Exception:
+            # No known ancestor found: fall back to the whole document
+            return await page.content()
+
+    async def extract_everything_js(self, page: Page) -> Dict:
+        """Run the single in-browser extraction pass; {} when it fails."""
+        try:
+            return await page.evaluate(self._EXTRACT_ALL_JS)
         except Exception as e:
-            print(f"  ⚠️  Could not extract peak rank: {e}")
-        
-        return current_rank or "Gold 2", peak_rank or "Gold 2"
-    
-    async def extract_stat_value(self, page: Page, stat_name: str) -> Optional[float]:
+            print(f"  \u26a0\ufe0f  In-page extraction failed: {e}")
+            return {}
+
+    def match_stat_values(self, raw: Dict[str, str],
+                          content: str) -> Dict[str, Optional[float]]:
         """
-        Extract a stat value from the page using CSS selectors.
-        Searches for elements with class="stat" containing title="{stat_name}"
-        
-        Args:
-            stat_name: Name of the stat to extract (kd, acs, winrate, headshot)
-            
-        Returns:
-            Float value of the stat, or None if not found
+        Match the {title: value} dict from the in-browser walk against the
+        tracked stat names (kd, acs, winrate, headshot) and parse floats,
+        falling back to the precompiled HTML regexes for anything the
+        walk missed.
         """
-        try:
-            # Mapping of stat names to tracker.gg search patterns
-            stat_titles = {
-                'kd': ['K/D Ratio', 'K/D', 'KD'],
-                'acs': ['ACS'],
-                'winrate': ['Win %', 'Win Rate'],
-                'headshot': ['Headshot %', 'HS %'],
-            }
-            
-            titles_to_search = stat_titles.get(stat_name.lower(), [stat_name])
-            
-            # Search all stat elements
-            stats_elements = await page.query_selector_all('.stat .numbers')
-            
-            for stat_el in stats_elements:
-                # Get stat name
-                name_el = await stat_el.query_selector('.name')
-                if name_el:
-                    name_text = await name_el.get_attribute('title')
-                    if not name_text:
-                        name_text = await name_el.inner_text()
-                    
-                    # Check if this is the stat we're looking for
-                    for title in titles_to_search:
-                        if title.lower() in name_text.lower():
-                            # Extract the value
-                            value_el = await stat_el.query_selector('.value')
-                            if value_el:
-                                value_text = await value_el.inner_text()
-                                # Clean and convert (remove % if present)
-                                value_clean = value_text.strip().replace('%', '').replace(',', '')
-                                try:
-                                    return float(value_clean)
-                                except ValueError:
-                                    continue
-            
-            # Fallback: search in raw HTML with regex
-            content = await page.content()
-            patterns = {
-                'kd': r'title="K/D Ratio"[^>]*>.*?<span[^>]*class="value"[^>]*>(\d+\.\d+)',
-                'acs': r'title="ACS"[^>]*>.*?<span[^>]*class="value"[^>]*>(\d+\.?\d*)',
-                'winrate': r'title="Win %"[^>]*>.*?<span[^>]*class="value"[^>]*>(\d+\.?\d*)%',
-                'headshot': r'title="Headshot %"[^>]*>.*?<span[^>]*class="value"[^>]*>(\d+\.?\d*)%',
-            }
-            
-            pattern = patterns.get(stat_name.lower())
-            if pattern:
-                match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-                if match:
-                    value = match.group(1)
-                    return float(value)
-            
-            return None
-            
-        except Exception as e:
-            print(f"  ⚠️  Error extracting stat '{stat_name}': {e}")
-            return None
-    
-    async def extract_account_level(self, page: Page) -> Optional[int]:
-        """Extract account level from the profile"""
-        try:
-            # Look for "Level" stat in highlighted section
-            content = await page.content()
-            level_match = re.search(
-                r'<span[^>]*class="stat__label"[^>]*>Level</span>\s*<span[^>]*class="stat__value"[^>]*>(\d+)',
-                content,
-                re.IGNORECASE | re.DOTALL
-            )
-            if level_match:
-                return int(level_match.group(1))
-            
-            return None
-        except Exception as e:
-            print(f"  ⚠️  Error extracting level: {e}")
-            return None
-    
-    async def extract_matches_played(self, page: Page) -> Optional[int]:
-        """Extract number of matches played this act"""
-        try:
-            # Look for "XXX Matches" text in the overview header
-            content = await page.content()
-            matches_match = re.search(
-                r'<span[^>]*class="matches"[^>]*>(\d+)\s+Matches',
-                content,
-                re.IGNORECASE | re.DOTALL
-            )
-            if matches_match:
-                return int(matches_match.group(1))
-            
-            # Alternative pattern
-            matches_match = re.search(r'(\d+)\s+Matches', content)
-            if matches_match:
-                return int(matches_match.group(1))
-            
-            return None
-        except Exception as e:
-            print(f"  ⚠️  Error extracting matches played: {e}")
-            return None
-    
+        results = dict.fromkeys(self.STAT_TITLES, None)
+
+        # One pass over the tiles: a dict probe resolves exact titles,
+        # with a substring sweep over the tiny index for decorated ones
+        # (e.g. "K/D Ratio (Current Act)")
+        for title, value_text in raw.items():
+            name_lower = title.strip().lower()
+            stat_name = self._TITLE_TO_STAT.get(name_lower)
+            if stat_name is None:
+                for wanted, canon in self._TITLE_TO_STAT.items():
+                    if wanted in name_lower:
+                        stat_name = canon
+                        break
+            if stat_name is None or results[stat_name] is not None:
+                continue
+            # Clean and convert (remove % if present)
+            value_clean = value_text.strip().replace('%', '').replace(',', '')
+            try:
+                results[stat_name] = float(value_clean)
+            except ValueError:
+                continue
+
+        # Fallback: locate each missing stat's title marker in the raw
+        # HTML, then search for the value only in the window after it
+        if content:
+            for stat_name, value in results.items():
+                if value is None:
+                    marker, value_re = _STAT_FALLBACKS[stat_name]
+                    idx = content.find(marker)
+                    if idx >= 0:
+                        match = value_re.search(content, idx, idx + _FALLBACK_WINDOW)
+                        if match:
+                            results[stat_name] = float(match.group(1))
+
+        return results
+
     async def extract_stats(self, page: Page) -> Dict:
         """
         Extract all stats from the loaded page.
@@ -277,25 +352,60 @@ class TrackerScraperHuman:
             Dictionary containing all player stats
         """
         print("  📊 Extracting stats...")
-        
-        # Extract rank (current and peak)
-        current_rank, peak_rank = await self.extract_rank(page)
+
+        # One in-browser pass returns every field as a small JSON blob
+        data = await self.extract_everything_js(page)
+        raw_stats = data.get('stats') or {}
+
+        # Serialize HTML only when the DOM walk came up short — and then
+        # only the profile subtree, not the megabyte-sized full document
+        content = ''
+        if not data.get('rank') or not data.get('peak') or not raw_stats:
+            content = await self.get_fallback_html(page)
+
+        # Current rank, cleaned up ("Rating" suffix, newlines, spacing)
+        current_rank = (data.get('rank') or '').replace("Rating", "").replace("\n", " ")
+        current_rank = " ".join(current_rank.split())
+        if not current_rank and content:
+            # Pattern: "Gold 2", "Platinum 1", etc.
+            rank_match = _RANK_RE.search(content)
+            if rank_match:
+                current_rank = rank_match.group(1)
+
+        # Peak rank: keep only a recognized rank name from the tile text,
+        # defaulting to the current rank
+        peak_rank = ''
+        peak_match = _RANK_RE.search(data.get('peak') or '')
+        if peak_match:
+            peak_rank = peak_match.group(1)
+        elif content:
+            # Anchor on the literal marker, then look for a rank name
+            # only in the window right after it
+            idx = content.find('Peak Rating')
+            if idx >= 0:
+                peak_match = _RANK_RE.search(content, idx, idx + _FALLBACK_WINDOW)
+                if peak_match:
+                    peak_rank = peak_match.group(1)
+        current_rank = current_rank or "Gold 2"
+        peak_rank = peak_rank or current_rank
+
         print(f"    - Rank: {current_rank} (Peak: {peak_rank})")
-        
-        # Extract main stats
-        kd = await self.extract_stat_value(page, 'kd')
-        acs = await self.extract_stat_value(page, 'acs')
-        winrate = await self.extract_stat_value(page, 'winrate')
-        headshot = await self.extract_stat_value(page, 'headshot')
-        
+
+        # Match the stat tiles against the tracked stat names
+        stat_values = self.match_stat_values(raw_stats, content)
+        kd = stat_values['kd']
+        acs = stat_values['acs']
+        winrate = stat_values['winrate']
+        headshot = stat_values['headshot']
+
         print(f"    - K/D: {kd}")
         print(f"    - ACS: {acs}")
         print(f"    - Win%: {winrate}")
         print(f"    - HS%: {headshot}")
-        
-        # Extract account info
-        level = await self.extract_account_level(page)
-        matches = await self.extract_matches_played(page)
+
+        # Account info came back from the same pass, already parsed
+        level = data.get('level')
+        matches = data.get('matches')
         
         print(f"    - Level: {level}")
         print(f"    - Matches: {matches}")
@@ -318,112 +428,164 @@ class TrackerScraperHuman:
         
         return stats
     
-    async def scrape_player(self, player_name: str, tag: str) -> Dict:
+    async def scrape_player(self, player_name: str, tag: str, context: BrowserContext) -> Dict:
         """
         Scrape a single player with human simulation.
-        
+
         Args:
             player_name: Player name
             tag: Player tag (with or without #)
-            
+            context: Shared browser context (owned by the caller)
+
         Returns:
             Dictionary with player stats
-            
+
         Raises:
             ValueError: If profile is private or not found
         """
         url = self.build_profile_url(player_name, tag)
-        
-        async with async_playwright() as p:
-            # Launch browser with "human" options
-            browser = await p.chromium.launch(
-                headless=self.headless,
-                slow_mo=self.slow_mo,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                ]
-            )
-            
-            # Context with realistic User-Agent
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            page = await context.new_page()
-            
-            # Hide bot detection
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                window.navigator.chrome = {runtime: {}};
-            """)
-            
+
+        # Fresh cache entry: skip the browser entirely (re-runs while
+        # tuning team balance re-scrape the same roster within minutes)
+        cache_file = self._cache_file(url)
+        cached = self._cache_load(cache_file)
+        if cached is not None:
+            print(f"  💾 Cache hit for {player_name}#{tag}")
+            return cached
+
+        # Only the page is per-player; the browser and context are shared
+        # across the whole batch (launching Chromium costs seconds)
+        page = await context.new_page()
+        try:
             print(f"  🌐 Navigating to: {url}")
-            
+
             # Navigation with permissive strategy
             try:
                 await page.goto(url, wait_until='domcontentloaded', timeout=15000)
             except Exception as e:
                 print(f"  ⚠️  Initial timeout, continuing anyway...")
-            
+
             # Wait a bit for JavaScript to load
             await asyncio.sleep(3)
-            
+
             # Simulate human scroll
             await page.mouse.move(random.randint(100, 500), random.randint(100, 500))
             await self.human_delay(1000, 2000)
-            
+
             # Wait for profile to load
             is_loaded = await self.wait_for_profile_load(page)
-            
+
             if not is_loaded:
-                await browser.close()
                 raise ValueError(f"❌ Profile is private or not found: {player_name}#{tag}")
-            
+
             # Extract stats
             stats = await self.extract_stats(page)
             stats["player_name"] = f"{player_name}#{tag}"
-            
-            await browser.close()
-            
+        finally:
+            await page.close()
+
+        self._cache_store(cache_file, stats)
+
         return stats
-    
-    async def scrape_multiple_players(self, players: List[tuple]) -> List[Dict]:
+
+    async def scrape_multiple_players(self, players: List[tuple],
+                                      max_concurrency: int = 3,
+                                      per_player_timeout: float = 45.0) -> List[Dict]:
         """
-        Scrape multiple players with rate limiting.
-        
+        Scrape multiple players concurrently with rate limiting.
+
+        The browser, context, and anti-detection init script are set up
+        once here and shared by every player: each scrape only opens a
+        fresh tab, so the batch pays a single Chromium cold start instead
+        of one per player. Up to max_concurrency tabs load in parallel
+        (each scrape is network/JS-wait bound, so they overlap almost
+        perfectly); the jittered delay staggers concurrent starts instead
+        of serializing the batch. Each scrape runs under its own timeout
+        and a stuck or failed player is logged and skipped, so one bad
+        profile can neither stall nor abort the rest of the roster.
+
         Args:
             players: List of (name, tag) tuples
-            
+            max_concurrency: Maximum number of simultaneous tabs
+            per_player_timeout: Wall-clock budget per player in seconds
+
         Returns:
-            List of player stats dictionaries
+            List of player stats dictionaries (failed players omitted)
         """
         results = []
-        
-        for i, (name, tag) in enumerate(players, 1):
-            print(f"\n[{i}/{len(players)}] 🎮 Scraping {name}#{tag}...")
-            
+
+        async with async_playwright() as p:
+            # Persistent profile with "human" options and a realistic
+            # User-Agent: cookies, HTTP cache, and any challenge
+            # clearance earned on a previous run are reused, so repeat
+            # runs skip the cold-cache costs of a fresh context
+            context = await p.chromium.launch_persistent_context(
+                self.profile_dir,
+                headless=self.headless,
+                slow_mo=self.slow_mo,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                args=[
+                    '--disable-blink-features=AutomationControlled',
+                    '--disable-dev-shm-usage',
+                ]
+            )
+
             try:
-                stats = await self.scrape_player(name, tag)
-                results.append(stats)
-                print("  ✅ Success!")
-                
-                # Rate limiting: wait between requests
-                if i < len(players):
-                    wait_time = random.uniform(3, 6)
-                    print(f"  ⏳ Waiting {wait_time:.1f}s before next player...")
-                    await asyncio.sleep(wait_time)
-                    
-            except ValueError as e:
-                print(f"  {e}")
-                print("  ⛔ STOPPING PROGRAM")
-                break
-            except Exception as e:
-                print(f"  ❌ Error: {e}")
-                print("  ⛔ STOPPING PROGRAM")
-                break
-        
+                # Hide bot detection; registered on the context so every
+                # new page gets it automatically
+                await context.add_init_script("""
+                    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+                    window.navigator.chrome = {runtime: {}};
+                """)
+
+                # Drop ads, images, fonts, and analytics at the wire:
+                # fewer bytes, faster loads, fewer timeout retries
+                await context.route("**/*", _route_filter)
+
+                sem = asyncio.Semaphore(max_concurrency)
+                total = len(players)
+
+                async def _one(index: int, name: str, tag: str) -> Optional[Dict]:
+                    async with sem:
+                        # Stagger starts so concurrent tabs don't hit
+                        # tracker.gg in lockstep
+                        if index > 1:
+                            await asyncio.sleep(random.uniform(1, 3))
+                        print(f"\n[{index}/{total}] 🎮 Scraping {name}#{tag}...")
+                        try:
+                            stats = await asyncio.wait_for(
+                                self.scrape_player(name, tag, context),
+                                timeout=per_player_timeout
+                            )
+                        except TimeoutError:
+                            print(f"  ⏱️  Timed out after {per_player_timeout:.0f}s: {name}#{tag}")
+                            return None
+                        except ValueError as e:
+                            print(f"  {e}")
+                            return None
+                        except Exception as e:
+                            print(f"  ❌ Error scraping {name}#{tag}: {e}")
+                            return None
+                        print(f"  ✅ Success: {name}#{tag}")
+                        return stats
+
+                # Every failure is caught inside _one, so the TaskGroup
+                # never cancels siblings; a stuck tab burns its own
+                # budget while the rest of the pool keeps moving
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(_one(i, name, tag))
+                             for i, (name, tag) in enumerate(players, 1)]
+
+                results = [task.result() for task in tasks
+                           if task.result() is not None]
+                failed = total - len(results)
+                if failed:
+                    print(f"\n  ⚠️  {failed} player(s) failed or timed out and were skipped")
+            finally:
+                # Clean close flushes cookies/cache to the profile dir
+                await context.close()
+
         return results
     
     def save_to_json(self, output_path: str):
@@ -432,14 +594,128 @@ class TrackerScraperHuman:
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
         data = {"players": self.players_data}
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
+
+        # Encode straight to UTF-8 bytes and write once; orjson (when
+        # installed) does the whole encode in C, and its unescaped UTF-8
+        # output matches the ensure_ascii=False behavior of the fallback
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        output_file.write_bytes(payload)
+
         print(f"\n✅ Data saved to: {output_path}")
         print(f"   Total players: {len(self.players_data)}")
 
 
+class TrackerScraperAPI:
+    """
+    Fast path: tracker.gg's JSON profile API over plain HTTP.
+
+    The site's own frontend fetches the same stats the browser scraper
+    regex-mines out of rendered HTML from a JSON endpoint; one GET per
+    player replaces a whole Chromium page load. Requires httpx. Players
+    the API refuses (403/503 challenge pages, unknown schema) are
+    reported back so the caller can retry them with the browser scraper.
+    """
+
+    API_URL = "https://api.tracker.gg/api/v2/valorant/standard/profile/riot/{identifier}"
+
+    def __init__(self, max_concurrency: int = 3, timeout: float = 15.0):
+        if httpx is None:
+            raise RuntimeError("httpx is not installed; use TrackerScraperHuman")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
+    @staticmethod
+    def _parse_profile(payload: Dict) -> Dict:
+        """Map one API payload onto the team_balancer.py stats format."""
+        data = payload.get('data') or {}
+        segments = data.get('segments') or []
+        # The lifetime overview segment carries the headline stats the
+        # profile page shows; fall back to whatever segment exists
+        segment = next((s for s in segments if s.get('type') == 'overview'),
+                       segments[0] if segments else {})
+        seg_stats = segment.get('stats') or {}
+
+        def value(key):
+            return (seg_stats.get(key) or {}).get('value')
+
+        def rank_name(key):
+            meta = (seg_stats.get(key) or {}).get('metadata') or {}
+            return " ".join((meta.get('tierName') or '').split())
+
+        current_rank = rank_name('rank') or "Gold 2"
+        peak_rank = rank_name('peakRank') or current_rank
+        kd = value('kDRatio')
+        acs = value('scorePerRound')
+        winrate = value('matchesWinPct')
+        headshot = value('headshotsPercentage')
+        matches = value('matchesPlayed')
+        level = (data.get('metadata') or {}).get('accountLevel')
+
+        return {
+            "player_name": "",  # Set by the caller
+            "rank_current": current_rank,
+            "rank_peak_recent": peak_rank,
+            "kd_ratio": kd or 1.0,
+            "average_combat_score": int(acs) if acs else 200,
+            "win_rate": winrate or 50.0,
+            "headshot_rate": headshot or 20.0,
+            "account_level": level or 100,
+            "total_ranked_matches": matches or 50,
+            "player_id": None,  # To be filled manually by admin
+            "admin_skill_rating": None,  # To be filled manually by admin
+            "admin_familiarity": None  # To be filled manually by admin
+        }
+
+    async def scrape_multiple_players(self, players: List[tuple]) -> Tuple[List[Dict], List[tuple]]:
+        """
+        Fetch players through the JSON API with one shared connection pool.
+
+        Args:
+            players: List of (name, tag) tuples
+
+        Returns:
+            (stats dicts for fetched players, (name, tag) tuples the API
+            could not serve — hand those to the browser scraper)
+        """
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'application/json',
+            'Origin': 'https://tracker.gg',
+            'Referer': 'https://tracker.gg/',
+        }
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async with httpx.AsyncClient(headers=headers, timeout=self.timeout,
+                                     follow_redirects=True) as client:
+            async def _one(name: str, tag: str) -> Dict:
+                async with sem:
+                    identifier = f"{quote(name, safe='')}%23{quote(tag.replace('#', ''), safe='')}"
+                    response = await client.get(self.API_URL.format(identifier=identifier))
+                    response.raise_for_status()
+                    stats = self._parse_profile(response.json())
+                    stats["player_name"] = f"{name}#{tag}"
+                    return stats
+
+            outcomes = await asyncio.gather(
+                *(_one(name, tag) for name, tag in players),
+                return_exceptions=True
+            )
+
+        results = []
+        leftover = []
+        for (name, tag), outcome in zip(players, outcomes):
+            if isinstance(outcome, BaseException):
+                print(f"  ⚠️  API fetch failed for {name}#{tag}: {outcome}")
+                leftover.append((name, tag))
+            else:
+                print(f"  ✅ API: {name}#{tag}")
+                results.append(outcome)
+        return results, leftover
+
+
 def parse_players_from_file(file_path: str) -> List[tuple]:
     """
     Parse players from a text file.
@@ -449,15 +725,15 @@ def parse_players_from_file(file_path: str) -> List[tuple]:
     Returns:
         List of (name, tag) tuples
     """
-    players = []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):  # Skip empty lines and comments
-                if '#' in line:
-                    name, tag = line.split('#', 1)
-                    players.append((name.strip(), tag.strip()))
-    return players
+    # One read, one pass: partition splits on the first '#' in a single
+    # C call (sep is empty when the line has no tag), and lines that are
+    # blank or comments are skipped before the split
+    text = Path(file_path).read_text(encoding='utf-8')
+    return [(name.strip(), tag.strip())
+            for raw in text.splitlines()
+            if (line := raw.strip()) and not line.startswith('#')
+            for name, sep, tag in [line.partition('#')]
+            if sep]
 
 
 async def main():
@@ -516,6 +792,38 @@ Input file format (players_list.txt):
         action='store_true',
         help='Run in headless mode (invisible) - may not load all stats correctly'
     )
+
+    parser.add_argument(
+        '--profile-dir',
+        type=str,
+        default='.playwright-profile',
+        help='Browser profile directory reused across runs (cookies/cache)'
+    )
+
+    parser.add_argument(
+        '--debug-slowmo',
+        action='store_true',
+        help='Slow every browser action by 100ms (watch what the scraper does)'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=3600.0,
+        help='Seconds a cached scrape result stays fresh (default: 3600)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always scrape live, ignoring and not writing the result cache'
+    )
+
+    parser.add_argument(
+        '--no-api',
+        action='store_true',
+        help='Skip the tracker.gg JSON API and always drive the browser'
+    )
     
     args = parser.parse_args()
     
@@ -551,11 +859,26 @@ Input file format (players_list.txt):
     print(f"{'='*60}\n")
     
     # Create scraper with appropriate mode
-    scraper = TrackerScraperHuman(headless=use_headless, slow_mo=100)
+    scraper = TrackerScraperHuman(headless=use_headless,
+                                  slow_mo=100 if args.debug_slowmo else 0,
+                                  profile_dir=args.profile_dir,
+                                  cache_dir=None if args.no_cache else '.tracker_cache',
+                                  cache_ttl=args.cache_ttl)
     
-    # Scrape players
+    # Scrape players: JSON API first when httpx is installed (one GET
+    # per player instead of a browser page load), browser for the rest
     try:
-        results = await scraper.scrape_multiple_players(players)
+        results = []
+        remaining = players
+        if httpx is not None and not args.no_api:
+            print("🚀 Trying the tracker.gg JSON API (no browser needed)...")
+            api_scraper = TrackerScraperAPI()
+            results, remaining = await api_scraper.scrape_multiple_players(players)
+            if remaining:
+                print(f"\n🌐 Falling back to the browser for {len(remaining)} player(s)...")
+
+        if remaining:
+            results.extend(await scraper.scrape_multiple_players(remaining))
         scraper.players_data = results
         
         if results: